@@ -1,12 +1,32 @@
 """City code ingestion pipeline package."""
 
-from .builder import build_outputs
-from .chunker import split_sections
-from .embedder import generate_embeddings
-from .ingest import extract_document, extract_layout, extract_text
-from .mapper import link_items
-from .schema_extractor import catalog_items
-from .validator import run_checks
+from importlib import import_module
+from typing import Any
+
+# Public names resolve on first access so that importing one submodule (or
+# running ``python -m city_code_ingest.main --help``) does not load numpy,
+# jsonschema and the rest of the pipeline up front.
+_EXPORTS = {
+    "extract_text": "ingest",
+    "extract_layout": "ingest",
+    "extract_document": "ingest",
+    "split_sections": "chunker",
+    "catalog_items": "schema_extractor",
+    "link_items": "mapper",
+    "build_outputs": "builder",
+    "generate_embeddings": "embedder",
+    "run_checks": "validator",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "extract_text",
@@ -3,19 +3,69 @@
 from __future__ import annotations
 
 import json
-from datetime import datetime
+import logging
+from datetime import datetime, timezone
+from itertools import cycle, groupby
+from operator import itemgetter
 from pathlib import Path
 from typing import Any, Dict, Iterable, List
 
+try:  # pragma: no cover - optional dependency
+    import orjson
+except ImportError:  # pragma: no cover - fall back to stdlib json
+    orjson = None  # type: ignore
+
+try:  # pragma: no cover - optional dependency
+    import jsonschema_rs
+except ImportError:  # pragma: no cover - fall back to pure-Python jsonschema
+    jsonschema_rs = None  # type: ignore
+
 try:  # pragma: no cover - optional dependency
     from jsonschema import Draft7Validator
+    from jsonschema.exceptions import SchemaError
 except ImportError:  # pragma: no cover - keep running without validation
     Draft7Validator = None  # type: ignore
+    SchemaError = ValueError  # type: ignore
+
 
+logger = logging.getLogger(__name__)
+
+# Shared default for missing list fields that are only read or serialised.
+_EMPTY: tuple = ()
 
 WIZARD_SCHEMA_PATH = Path(__file__).resolve().parent / "schema" / "wizard_schema.json"
 
 
+def _load_validator(path: Path) -> Any:
+    """Compile the schema at ``path`` once.
+
+    Returns ``None`` without a validator backend, or when the schema cannot be
+    read or compiled, so wizard validation is skipped instead of failing import.
+    """
+
+    if jsonschema_rs is None and Draft7Validator is None:
+        logger.warning("[builder] jsonschema not available; skipping wizard validation")
+        return None
+
+    try:
+        if orjson is not None:
+            schema = orjson.loads(path.read_bytes())
+        else:
+            with path.open("r", encoding="utf-8") as handle:
+                schema = json.load(handle)
+        if jsonschema_rs is not None:
+            # Invalid schemas raise jsonschema_rs.ValidationError, a ValueError.
+            return jsonschema_rs.Draft7Validator(schema)
+        Draft7Validator.check_schema(schema)
+        return Draft7Validator(schema)
+    except (OSError, ValueError, SchemaError) as exc:
+        logger.warning("[builder] Unable to load wizard schema %s (%s); skipping wizard validation", path, exc)
+        return None
+
+
+_WIZARD_VALIDATOR = _load_validator(WIZARD_SCHEMA_PATH)
+
+
 def build_outputs(
     decision_points: List[Dict[str, Any]],
     *,
@@ -46,22 +96,18 @@ def _assign_decision_points_to_sections(
     decision_points: List[Dict[str, Any]],
     sections_list: List[Dict[str, Any]],
 ) -> List[Dict[str, Any]]:
-    section_wrappers: list[dict[str, Any]] = []
-    for idx, section in enumerate(sections_list):
-        section_wrappers.append(
-            {
-                "meta": section,
-                "decision_points": [],
-            }
-        )
+    if decision_points and not sections_list:
+        # zip() against an empty cycle would silently drop every decision point.
+        raise ValueError("No sections available to assign decision points to")
+
+    section_wrappers: list[dict[str, Any]] = [
+        {"meta": section, "decision_points": []} for section in sections_list
+    ]
 
     # Simple heuristic: assign by round-robin order of appearance
     # Future enhancement could use page numbers.
-    current_index = 0
-    for dp in decision_points:
-        section_wrappers[current_index]["decision_points"].append(dp)
-        if len(section_wrappers) > 1:
-            current_index = (current_index + 1) % len(section_wrappers)
+    for dp, wrapper in zip(decision_points, cycle(section_wrappers)):
+        wrapper["decision_points"].append(dp)
 
     return section_wrappers
 
@@ -73,64 +119,46 @@ def _build_wizard(
     version: str,
     source_url: str,
 ) -> Dict[str, Any]:
-    titles: dict[int, Dict[str, Any]] = {}
-
+    # One stable sort by (title, chapter) keeps sections in document order
+    # within each chapter; groupby then emits the nested payload in one pass.
+    rows: list[tuple[Any, Any, Dict[str, Any], Dict[str, Any]]] = []
+    # Title names come from the first section of each title in document order,
+    # which is not necessarily the first row once chapters are sorted.
+    title_metas: dict[Any, Dict[str, Any]] = {}
     for wrapper in section_assignments:
         section_meta = wrapper["meta"]
-        decision_points = wrapper["decision_points"]
-
         section_id = section_meta.get("section_id") or "section-1"
-        title_number = section_meta.get("title_number") or 1
-        chapter_number = section_meta.get("chapter_number") or 1
-
-        title_entry = titles.setdefault(
-            title_number,
-            {
-                "title_number": int(title_number),
-                "title_name": section_meta.get("title_name") or f"Title {title_number}",
-                "chapters": {},
-            },
-        )
-
-        chapters = title_entry["chapters"]
-        chapter_entry = chapters.setdefault(
-            chapter_number,
-            {
-                "chapter_number": int(chapter_number),
-                "chapter_name": section_meta.get("chapter_name") or f"Chapter {chapter_number}",
-                "sections": [],
-            },
-        )
-
-        breadcrumbs = _build_breadcrumbs(section_meta)
-        topics = section_meta.get("topics", []) or []
         section_entry = {
             "section_id": section_id,
             "section_title": section_meta.get("heading") or section_id,
-            "breadcrumbs": breadcrumbs,
-            "topics": topics,
-            "decision_points": decision_points,
+            "breadcrumbs": _build_breadcrumbs(section_meta),
+            "topics": section_meta.get("topics") or [],
+            "decision_points": wrapper["decision_points"],
         }
-
-        chapter_entry["sections"].append(section_entry)
+        title_number = section_meta.get("title_number") or 1
+        title_metas.setdefault(title_number, section_meta)
+        rows.append((title_number, section_meta.get("chapter_number") or 1, section_meta, section_entry))
+    rows.sort(key=itemgetter(0, 1))
 
     titles_payload: list[dict[str, Any]] = []
-    for title_number, title_entry in sorted(titles.items(), key=lambda item: item[0]):
-        chapters_payload = []
-        for chapter_number, chapter_entry in sorted(title_entry["chapters"].items(), key=lambda item: item[0]):
-            sections_payload = chapter_entry["sections"]
+    for title_number, title_group in groupby(rows, key=itemgetter(0)):
+        title_meta = title_metas[title_number]
+        chapters_payload: list[dict[str, Any]] = []
+        for chapter_number, chapter_group in groupby(title_group, key=itemgetter(1)):
+            chapter_rows = list(chapter_group)
+            chapter_meta = chapter_rows[0][2]
             chapters_payload.append(
                 {
-                    "chapter_number": chapter_entry["chapter_number"],
-                    "chapter_name": chapter_entry["chapter_name"],
-                    "sections": sections_payload,
+                    "chapter_number": int(chapter_number),
+                    "chapter_name": chapter_meta.get("chapter_name") or f"Chapter {chapter_number}",
+                    "sections": [row[3] for row in chapter_rows],
                 }
             )
 
         titles_payload.append(
             {
-                "title_number": title_entry["title_number"],
-                "title_name": title_entry["title_name"],
+                "title_number": int(title_number),
+                "title_name": title_meta.get("title_name") or f"Title {title_number}",
                 "chapters": chapters_payload,
             }
         )
@@ -140,7 +168,7 @@ def _build_wizard(
             "city": city,
             "state": state,
             "version": version,
-            "last_updated": datetime.utcnow().date().isoformat(),
+            "last_updated": datetime.now(timezone.utc).date().isoformat(),
             "source_url": source_url,
         },
         "titles": titles_payload,
@@ -182,9 +210,9 @@ def _build_guidance(
                     "entry_type": "decision_point",
                     "question_id": dp.get("rad_id"),
                     "guidance": dp.get("rad_text"),
-                    "po_details": dp.get("po_details", []),
-                    "ead_details": dp.get("ead_details", []),
-                    "source_refs": dp.get("source_refs", []),
+                    "po_details": dp.get("po_details", _EMPTY),
+                    "ead_details": dp.get("ead_details", _EMPTY),
+                    "source_refs": dp.get("source_refs", _EMPTY),
                 }
             )
 
@@ -196,43 +224,43 @@ def _build_guidance(
 
 
 def _build_breadcrumbs(section_meta: Dict[str, Any]) -> List[str]:
-    breadcrumbs: list[str] = []
-    title_number = section_meta.get("title_number")
-    title_name = section_meta.get("title_name")
-    chapter_number = section_meta.get("chapter_number")
-    chapter_name = section_meta.get("chapter_name")
+    get = section_meta.get
+    title_number = get("title_number")
+    title_name = get("title_name")
+    chapter_number = get("chapter_number")
+    chapter_name = get("chapter_name")
+    section_heading = get("heading")
 
+    breadcrumbs: list[str] = []
     if title_number is not None:
-        label = f"Title {title_number}"
-        if title_name:
-            label += f": {title_name}"
-        breadcrumbs.append(label)
-
+        breadcrumbs.append(f"Title {title_number}: {title_name}" if title_name else f"Title {title_number}")
     if chapter_number is not None:
-        label = f"Chapter {chapter_number}"
-        if chapter_name:
-            label += f": {chapter_name}"
-        breadcrumbs.append(label)
-
-    section_heading = section_meta.get("heading")
+        breadcrumbs.append(f"Chapter {chapter_number}: {chapter_name}" if chapter_name else f"Chapter {chapter_number}")
     if section_heading:
         breadcrumbs.append(section_heading)
 
-    return breadcrumbs or [section_meta.get("breadcrumb", "")] if section_meta.get("breadcrumb") else []
+    if breadcrumbs:
+        return breadcrumbs
+    breadcrumb = get("breadcrumb")
+    return [breadcrumb] if breadcrumb else []
 
 
 def _validate_wizard(payload: Dict[str, Any]) -> None:
-    if Draft7Validator is None:
-        print("[builder] jsonschema not available; skipping wizard validation")
+    if _WIZARD_VALIDATOR is None:
+        logger.warning("[builder] No wizard schema validator; skipping wizard validation")
         return
 
-    with WIZARD_SCHEMA_PATH.open("r", encoding="utf-8") as handle:
-        schema = json.load(handle)
-    validator = Draft7Validator(schema)
-    errors = sorted(validator.iter_errors(payload), key=lambda e: e.path)
-    if errors:
-        messages = ", ".join(f"{'/'.join(map(str, err.path))}: {err.message}" for err in errors)
-        raise ValueError(f"Wizard payload failed schema validation: {messages}")
+    if _WIZARD_VALIDATOR.is_valid(payload):
+        return
+
+    errors = sorted(_WIZARD_VALIDATOR.iter_errors(payload), key=lambda e: list(_error_path(e)))
+    messages = ", ".join(f"{'/'.join(map(str, _error_path(err)))}: {err.message}" for err in errors)
+    raise ValueError(f"Wizard payload failed schema validation: {messages}")
+
+
+def _error_path(error: Any) -> Iterable[Any]:
+    # jsonschema_rs exposes ``instance_path``; pure-Python jsonschema uses ``path``.
+    return error.instance_path if hasattr(error, "instance_path") else error.path
 
 
 __all__ = ["build_outputs"]
@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import io
+import logging
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Dict, List, Optional
 
 
+# Individual heading patterns, kept for callers that match one heading kind.
 SECTION_PATTERN = re.compile(
     r"^(?:Section\s+)?(?P<id>\d{1,2}\.\d{1,2}\.\d{1,3})\s+[-:]?\s*(?P<title>.+)$",
     re.IGNORECASE,
@@ -14,8 +17,27 @@ SECTION_PATTERN = re.compile(
 TITLE_PATTERN = re.compile(r"^Title\s+(?P<num>\d+)\s*[-:\.]?\s*(?P<name>.*)$", re.IGNORECASE)
 CHAPTER_PATTERN = re.compile(r"^Chapter\s+(?P<num>\d+)\s*[-:\.]?\s*(?P<name>.*)$", re.IGNORECASE)
 
+# split_sections matches the three patterns above fused into one alternation so
+# each line is matched once. Title and chapter branches come first, as they
+# took precedence over SECTION_PATTERN when the patterns were tried in turn.
+HEADING_PATTERN = re.compile(
+    r"^(?:"
+    r"Title\s+(?P<title_num>\d+)\s*[-:\.]?\s*(?P<title_name>.*)"
+    r"|Chapter\s+(?P<chapter_num>\d+)\s*[-:\.]?\s*(?P<chapter_name>.*)"
+    r"|(?:Section\s+)?(?P<section_id>\d{1,2}\.\d{1,2}\.\d{1,3})\s+[-:]?\s*(?P<section_title>.+)"
+    r")$",
+    re.IGNORECASE,
+)
+
+logger = logging.getLogger(__name__)
+
+# Every heading pattern is anchored and begins with a digit (any Unicode digit,
+# as ``\d`` matches) or one of these letters, including the long s that
+# IGNORECASE folds to "s"; anything else is body text and can skip the regex.
+_HEADING_LETTERS = frozenset("TtCcSs\u017f")
 
-@dataclass
+
+@dataclass(slots=True)
 class _SectionAccumulator:
     section_id: str
     heading: str
@@ -24,13 +46,17 @@ class _SectionAccumulator:
     chapter_number: Optional[int]
     chapter_name: Optional[str]
     breadcrumb: str
-    body_lines: List[str]
+    body: io.StringIO = field(default_factory=io.StringIO)
+
+    def append_line(self, line: str) -> None:
+        self.body.write(line)
+        self.body.write("\n")
 
     def to_dict(self) -> Dict[str, str]:
         return {
             "section_id": self.section_id,
             "heading": self.heading,
-            "body": "\n".join(self.body_lines).strip(),
+            "body": self.body.getvalue().strip(),
             "title_number": self.title_number,
             "title_name": self.title_name,
             "chapter_number": self.chapter_number,
@@ -42,64 +68,64 @@ class _SectionAccumulator:
 def split_sections(text_lines: List[str]) -> List[Dict[str, str]]:
     """Group lines into titled sections using heading regex heuristics."""
 
-    print("[chunker] Splitting text into sections")
+    logger.info("[chunker] Splitting text into sections")
     sections: list[dict[str, str]] = []
     current: Optional[_SectionAccumulator] = None
     current_title: tuple[Optional[int], Optional[str]] = (None, None)
     current_chapter: tuple[Optional[int], Optional[str]] = (None, None)
 
     for line in text_lines:
-        title_match = TITLE_PATTERN.match(line)
-        if title_match:
-            number = int(title_match.group("num"))
-            name = title_match.group("name").strip() or None
-            current_title = (number, name)
-            print(f"[chunker] Found title {number}: {name or 'Unnamed'}")
+        first = line[:1]
+        heading_match = (
+            HEADING_PATTERN.match(line) if first in _HEADING_LETTERS or first.isdigit() else None
+        )
+        if heading_match is None:
+            if current is not None:
+                current.append_line(line)
             continue
 
-        chapter_match = CHAPTER_PATTERN.match(line)
-        if chapter_match:
-            number = int(chapter_match.group("num"))
-            name = chapter_match.group("name").strip() or None
-            current_chapter = (number, name)
-            print(f"[chunker] Found chapter {number}: {name or 'Unnamed'}")
+        if heading_match.group("title_num") is not None:
+            number = int(heading_match.group("title_num"))
+            name = heading_match.group("title_name").strip() or None
+            current_title = (number, name)
+            logger.debug("[chunker] Found title %s: %s", number, name or "Unnamed")
             continue
 
-        section_match = SECTION_PATTERN.match(line)
-        if section_match:
-            if current is not None:
-                sections.append(current.to_dict())
-            section_id = section_match.group("id")
-            title_fragment = section_match.group("title").strip()
-            heading = f"Section {section_id} {title_fragment}".strip()
-            breadcrumb = _build_breadcrumb(
-                title_number=current_title[0],
-                title_name=current_title[1],
-                chapter_number=current_chapter[0],
-                chapter_name=current_chapter[1],
-                section_id=section_id,
-                section_title=title_fragment,
-            )
-
-            current = _SectionAccumulator(
-                section_id=section_id,
-                heading=heading,
-                title_number=current_title[0],
-                title_name=current_title[1],
-                chapter_number=current_chapter[0],
-                chapter_name=current_chapter[1],
-                breadcrumb=breadcrumb,
-                body_lines=[],
-            )
+        if heading_match.group("chapter_num") is not None:
+            number = int(heading_match.group("chapter_num"))
+            name = heading_match.group("chapter_name").strip() or None
+            current_chapter = (number, name)
+            logger.debug("[chunker] Found chapter %s: %s", number, name or "Unnamed")
             continue
 
         if current is not None:
-            current.body_lines.append(line)
+            sections.append(current.to_dict())
+        section_id = heading_match.group("section_id")
+        title_fragment = heading_match.group("section_title").strip()
+        heading = f"Section {section_id} {title_fragment}".strip()
+        breadcrumb = _build_breadcrumb(
+            title_number=current_title[0],
+            title_name=current_title[1],
+            chapter_number=current_chapter[0],
+            chapter_name=current_chapter[1],
+            section_id=section_id,
+            section_title=title_fragment,
+        )
+
+        current = _SectionAccumulator(
+            section_id=section_id,
+            heading=heading,
+            title_number=current_title[0],
+            title_name=current_title[1],
+            chapter_number=current_chapter[0],
+            chapter_name=current_chapter[1],
+            breadcrumb=breadcrumb,
+        )
 
     if current is not None:
         sections.append(current.to_dict())
 
-    print(f"[chunker] Created {len(sections)} sections")
+    logger.info("[chunker] Created %d sections", len(sections))
     return sections
 
 
@@ -114,21 +140,10 @@ def _build_breadcrumb(
 ) -> str:
     parts: List[str] = []
     if title_number is not None:
-        title_label = f"Title {title_number}"
-        if title_name:
-            title_label += f": {title_name}"
-        parts.append(title_label)
-
+        parts.append(f"Title {title_number}: {title_name}" if title_name else f"Title {title_number}")
     if chapter_number is not None:
-        chapter_label = f"Chapter {chapter_number}"
-        if chapter_name:
-            chapter_label += f": {chapter_name}"
-        parts.append(chapter_label)
-
-    section_label = f"Section {section_id}"
-    if section_title:
-        section_label += f": {section_title}"
-    parts.append(section_label)
+        parts.append(f"Chapter {chapter_number}: {chapter_name}" if chapter_name else f"Chapter {chapter_number}")
+    parts.append(f"Section {section_id}: {section_title}" if section_title else f"Section {section_id}")
 
     return " > ".join(parts)
 
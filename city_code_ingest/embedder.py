@@ -2,11 +2,36 @@
 
 from __future__ import annotations
 
+import gzip
+import hashlib
 import json
+import logging
 import os
 import random
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from itertools import chain, islice
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from city_code_ingest.embedding_cache import DEFAULT_CACHE_PATH, EmbeddingCache
+
+try:  # pragma: no cover - optional dependency
+    import ijson
+except ImportError:  # pragma: no cover - fall back to json.load
+    ijson = None  # type: ignore
+
+try:  # pragma: no cover - optional dependency
+    import orjson
+except ImportError:  # pragma: no cover - fall back to stdlib json
+    orjson = None  # type: ignore
+
+try:  # pragma: no cover - optional dependency
+    import numpy as np
+except ImportError:  # pragma: no cover - fall back to the stdlib RNG
+    np = None  # type: ignore
 
 try:  # pragma: no cover - optional dependency
     from tqdm import tqdm
@@ -15,7 +40,21 @@ except ImportError:  # pragma: no cover - fallback
         return iterable
 
 
+logger = logging.getLogger(__name__)
+
 EMBEDDING_DIM = 1536
+EMBEDDING_MODEL = "text-embedding-3-small"
+EMBEDDING_BATCH_SIZE = 128
+EMBEDDING_CONCURRENCY = 8
+
+# Outputs ending in .gz are compressed; level 1 keeps compression cheap next to serialisation.
+_GZIP_LEVEL = 1
+
+_CLIENT: Any = None
+_CLIENT_LOCK = threading.Lock()
+
+# (text to embed, fallback seed, output record awaiting its "embedding")
+_EmbeddingJob = Tuple[str, str, Dict[str, Any]]
 
 
 def generate_embeddings(
@@ -26,67 +65,24 @@ def generate_embeddings(
     extra_metadata: Optional[Dict[str, Any]] = None,
     use_llm: bool = False,
     embed_level: str = "decision_point",
+    cache_path: str | Path | None = DEFAULT_CACHE_PATH,
+    binary: bool = False,
 ) -> Path:
     input_path = Path(json_path)
     if not input_path.exists():
         raise FileNotFoundError(f"JSON payload not found: {json_path}")
 
-    with input_path.open("r", encoding="utf-8") as handle:
-        payload = json.load(handle)
-
-    jurisdiction = payload.get("jurisdiction", {})
+    jurisdiction, titles = _open_payload(input_path)
     city = jurisdiction.get("city", "city")
     version = jurisdiction.get("version", "version")
     namespace = f"{_slug(city)}_{version}"
+    id_prefix = _vector_id_prefix(city, version)
 
-    vectors: list[Dict[str, Any]] = []
-    section_count = 0
-    item_count = 0
-
-    for title in payload.get("titles", []):
-        title_name = title.get("title_name", "")
-        for chapter in title.get("chapters", []):
-            chapter_name = chapter.get("chapter_name", "")
-            for section in chapter.get("sections", []):
-                section_count += 1
-                section_vectors, section_items = _embed_section(
-                    section,
-                    title_name=title_name,
-                    chapter_name=chapter_name,
-                    city=city,
-                    version=version,
-                    use_llm=use_llm,
-                    embed_level=embed_level,
-                )
-                vectors.extend(section_vectors)
-                item_count += section_items
-
-    if not vectors:  # fallback to section-level embeddings when decision points absent
-        for title in payload.get("titles", []):
-            title_name = title.get("title_name", "")
-            for chapter in title.get("chapters", []):
-                chapter_name = chapter.get("chapter_name", "")
-                for section in chapter.get("sections", []):
-                    section_id = section.get("section_id", "section")
-                    text = section.get("text") or section.get("section_title", "")
-                    vector = _generate_vector(text, seed=section_id, use_llm=use_llm)
-                    vectors.append(
-                        {
-                            "id": _vector_id(city, version, section_id),
-                            "embedding": vector,
-                            "metadata": {
-                                "type": "section",
-                                "section_id": section_id,
-                                "section_title": section.get("section_title"),
-                                "chapter": chapter_name,
-                                "title": title_name,
-                                "page_span": None,
-                                "jurisdiction": city,
-                                "po_ids": [],
-                            },
-                        }
-                    )
-        item_count = len(vectors)
+    counts = _JobCounts()
+    jobs = _iter_jobs(titles, city=city, id_prefix=id_prefix, embed_level=embed_level, counts=counts)
+    first_job = next(jobs, None)
+    if first_job is not None:
+        jobs = chain((first_job,), jobs)
 
     target_path = (
         Path(output_path)
@@ -95,41 +91,128 @@ def generate_embeddings(
     )
     target_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with target_path.open("w", encoding="utf-8") as handle:
-        json.dump(vectors, handle, indent=2)
+    if binary and np is None:
+        logger.warning("[embedder] numpy not installed; writing embeddings as JSON instead of a binary sidecar")
+        binary = False
 
-    if pinecone_config and vectors:
-        _persist_to_pinecone(
-            vectors,
-            pinecone_config,
-            namespace=namespace,
-            extra_metadata=extra_metadata,
-        )
-
-    print(f"[embedder] Embedded {item_count} {embed_level}(s) across {section_count} sections.")
+    cache = EmbeddingCache(Path(cache_path)) if use_llm and cache_path else None
+    try:
+        embedded = _iter_embedded_records(jobs, use_llm=use_llm, cache=cache)
+        if binary:
+            # The memmap needs its row count up front; count in a second, vector-free pass.
+            count_titles = _open_payload(input_path)[1] if ijson is not None else titles
+            row_count = sum(
+                1
+                for _ in _iter_jobs(
+                    count_titles, city=city, id_prefix=id_prefix, embed_level=embed_level, counts=_JobCounts()
+                )
+            )
+            records = _write_binary_records(embedded, target_path, count=row_count)
+            target_path = _binary_paths(target_path)[0]
+        else:
+            records = _write_records(embedded, target_path)
+        if pinecone_config and first_job is not None:
+            _persist_to_pinecone(
+                records,
+                pinecone_config,
+                namespace=namespace,
+                extra_metadata=extra_metadata,
+            )
+        # Finish writing whatever the Pinecone upsert did not consume, including
+        # after a Pinecone failure (which _persist_to_pinecone logs and absorbs).
+        # Writer and embedder failures are re-raised there and never reach here.
+        deque(records, maxlen=0)
+    finally:
+        if cache is not None:
+            cache.close()
+
+    print(f"[embedder] Embedded {counts.items} {embed_level}(s) across {counts.sections} sections.")
     print(f"[embedder] Wrote embeddings to {target_path}")
     return target_path
 
 
+def _open_payload(path: Path) -> tuple[Dict[str, Any], Iterable[Dict[str, Any]]]:
+    """Return the payload's jurisdiction block and an iterable over its titles.
+
+    With ijson installed, titles are parsed one at a time as they are consumed
+    instead of loading the whole wizard payload up front.
+    """
+
+    if ijson is None:
+        with _open_file(path, "rb") as handle:
+            payload = json.load(handle)
+        return payload.get("jurisdiction", {}), payload.get("titles", [])
+
+    with _open_file(path, "rb") as handle:
+        jurisdiction = next(ijson.items(handle, "jurisdiction", use_float=True), {})
+    return jurisdiction, _stream_titles(path)
+
+
+def _stream_titles(path: Path) -> Iterator[Dict[str, Any]]:
+    with _open_file(path, "rb") as handle:
+        yield from ijson.items(handle, "titles.item", use_float=True)
+
+
+def _open_file(path: Path, mode: str) -> IO[bytes]:
+    """Open ``path`` in binary ``mode``, transparently gzip-compressed for ``.gz`` paths."""
+
+    if path.suffix == ".gz":
+        return gzip.open(path, mode, compresslevel=_GZIP_LEVEL)  # type: ignore[return-value]
+    return path.open(mode)
+
+
+@dataclass
+class _JobCounts:
+    items: int = 0
+    sections: int = 0
+
+
+def _iter_jobs(
+    titles: Iterable[Dict[str, Any]],
+    *,
+    city: str,
+    id_prefix: str,
+    embed_level: str,
+    counts: _JobCounts,
+) -> Iterator[_EmbeddingJob]:
+    """Yield embedding jobs section by section, tallying them into ``counts`` as they go."""
+
+    for title in titles:
+        title_name = title.get("title_name", "")
+        for chapter in title.get("chapters", []):
+            chapter_name = chapter.get("chapter_name", "")
+            for section in chapter.get("sections", []):
+                section_jobs = _embed_section(
+                    section,
+                    title_name=title_name,
+                    chapter_name=chapter_name,
+                    city=city,
+                    id_prefix=id_prefix,
+                    embed_level=embed_level,
+                )
+                counts.sections += 1
+                counts.items += len(section_jobs)
+                yield from section_jobs
+
+
 def _embed_section(
     section: Dict[str, Any],
     *,
     title_name: str,
     chapter_name: str,
     city: str,
-    version: str,
-    use_llm: bool,
+    id_prefix: str,
     embed_level: str,
-) -> tuple[List[Dict[str, Any]], int]:
+) -> List[_EmbeddingJob]:
+    """Return the embedding jobs for one section; vectors are filled in later in batches."""
+
     section_id = section.get("section_id", "section")
     decision_points = section.get("decision_points", []) or []
 
     if embed_level == "decision_point" and decision_points:
-        records: list[Dict[str, Any]] = []
-        for dp in tqdm(decision_points, desc="Embedding decision points", leave=False):
+        jobs: list[_EmbeddingJob] = []
+        for dp in decision_points:
             rad_id = dp.get("rad_id", "RAD")
-            text_blob = _compose_decision_blob(dp)
-            vector = _generate_vector(text_blob, seed=rad_id, use_llm=use_llm)
             metadata = {
                 "type": "decision_point",
                 "rad_id": rad_id,
@@ -141,23 +224,25 @@ def _embed_section(
                 "page_span": _resolve_page_span(dp.get("source_refs", [])),
                 "jurisdiction": city,
             }
-            records.append(
-                {
-                    "id": _vector_id(city, version, rad_id),
-                    "embedding": vector,
-                    "metadata": metadata,
-                }
+            jobs.append(
+                (
+                    _compose_decision_blob(dp),
+                    rad_id,
+                    {
+                        "id": _vector_id(id_prefix, rad_id),
+                        "embedding": None,
+                        "metadata": metadata,
+                    },
+                )
             )
-        return records, len(records)
+        return jobs
 
     if embed_level == "po" and decision_points:
-        records: list[Dict[str, Any]] = []
-        for dp in tqdm(decision_points, desc="Embedding PO entries", leave=False):
+        jobs = []
+        for dp in decision_points:
             rad_id = dp.get("rad_id", "RAD")
             for detail in dp.get("po_details", []):
                 po_id = detail.get("po_id", "PO")
-                text_blob = _compose_po_blob(detail, dp)
-                vector = _generate_vector(text_blob, seed=f"{rad_id}_{po_id}", use_llm=use_llm)
                 metadata = {
                     "type": "po",
                     "rad_id": rad_id,
@@ -169,17 +254,22 @@ def _embed_section(
                     "page_span": detail.get("span") or _resolve_page_span(dp.get("source_refs", [])),
                     "jurisdiction": city,
                 }
-                records.append(
-                    {
-                        "id": _vector_id(city, version, f"{rad_id}_{po_id}"),
-                        "embedding": vector,
-                        "metadata": metadata,
-                    }
+                jobs.append(
+                    (
+                        _compose_po_blob(detail, dp),
+                        f"{rad_id}_{po_id}",
+                        {
+                            "id": _vector_id(id_prefix, f"{rad_id}_{po_id}"),
+                            "embedding": None,
+                            "metadata": metadata,
+                        },
+                    )
                 )
-        return records, len(records)
+        if jobs:
+            return jobs
 
+    # Section-level embedding, also used when a section yields no PO entries.
     text_blob = section.get("text") or section.get("section_title", "")
-    vector = _generate_vector(text_blob, seed=section_id, use_llm=use_llm)
     metadata = {
         "type": "section",
         "section_id": section_id,
@@ -190,41 +280,254 @@ def _embed_section(
         "jurisdiction": city,
         "po_ids": [],
     }
-    return (
-        [
+    return [
+        (
+            text_blob,
+            section_id,
             {
-                "id": _vector_id(city, version, section_id),
-                "embedding": vector,
+                "id": _vector_id(id_prefix, section_id),
+                "embedding": None,
                 "metadata": metadata,
-            }
-        ],
-        1,
+            },
+        )
+    ]
+
+
+def _iter_embedded_records(
+    jobs: Iterable[_EmbeddingJob],
+    *,
+    use_llm: bool,
+    cache: Optional[EmbeddingCache] = None,
+) -> Iterator[Dict[str, Any]]:
+    """Yield each job's record with its embedding, one ``EMBEDDING_BATCH_SIZE`` batch at a time.
+
+    With the OpenAI client, up to ``EMBEDDING_CONCURRENCY`` batch requests are kept
+    in flight on worker threads; records are still yielded in job order.
+    """
+
+    batches = _batched(jobs, EMBEDDING_BATCH_SIZE)
+    client = _openai_client() if use_llm else None
+    if client is None:
+        for batch in tqdm(batches, desc="Embedding batches", leave=False):
+            yield from _finish_batch(_PendingBatch(batch, [None] * len(batch)))
+        return
+
+    with ThreadPoolExecutor(max_workers=EMBEDDING_CONCURRENCY) as executor:
+        in_flight: deque[_PendingBatch] = deque()
+        for batch in tqdm(batches, desc="Embedding batches", leave=False):
+            in_flight.append(_submit_batch(executor, client, batch, cache))
+            if len(in_flight) > EMBEDDING_CONCURRENCY:
+                yield from _finish_batch(in_flight.popleft(), cache=cache)
+        while in_flight:
+            yield from _finish_batch(in_flight.popleft(), cache=cache)
+
+
+def _batched(jobs: Iterable[_EmbeddingJob], size: int) -> Iterator[List[_EmbeddingJob]]:
+    iterator = iter(jobs)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+@dataclass
+class _PendingBatch:
+    jobs: List[_EmbeddingJob]
+    vectors: List[Optional[List[float]]]
+    # cache key (or job index without a cache) -> indices sharing that text
+    pending: Dict[Any, List[int]] = field(default_factory=dict)
+    future: Optional[Future] = None
+
+
+def _submit_batch(
+    executor: ThreadPoolExecutor,
+    client: Any,
+    jobs: List[_EmbeddingJob],
+    cache: Optional[EmbeddingCache],
+) -> _PendingBatch:
+    """Resolve cache hits, then submit one API request for the remaining distinct texts."""
+
+    texts = [text or "" for text, _, _ in jobs]
+    batch = _PendingBatch(jobs, [None] * len(jobs))
+    if cache is not None:
+        keys = [EmbeddingCache.key(EMBEDDING_MODEL, text) for text in texts]
+        hits = cache.get_many(list(dict.fromkeys(keys)))
+        for idx, key in enumerate(keys):
+            if key in hits:
+                batch.vectors[idx] = hits[key]
+            else:
+                batch.pending.setdefault(key, []).append(idx)
+    else:
+        for idx in range(len(texts)):
+            batch.pending[idx] = [idx]
+
+    if batch.pending:
+        batch.future = executor.submit(
+            client.embeddings.create,
+            model=EMBEDDING_MODEL,
+            input=[texts[indices[0]] for indices in batch.pending.values()],
+        )
+    return batch
+
+
+def _finish_batch(batch: _PendingBatch, *, cache: Optional[EmbeddingCache] = None) -> Iterator[Dict[str, Any]]:
+    if batch.future is not None:
+        try:  # pragma: no cover - network dependency
+            response = batch.future.result()
+        except Exception as exc:  # pragma: no cover
+            print(f"[embedder] OpenAI embedding failed ({exc}); using fallback")
+        else:
+            pending_keys = list(batch.pending)
+            for item in response.data:
+                for idx in batch.pending[pending_keys[item.index]]:
+                    batch.vectors[idx] = item.embedding
+            if cache is not None:
+                cache.put_many(
+                    ((pending_keys[item.index], item.embedding) for item in response.data),
+                    model=EMBEDDING_MODEL,
+                )
+
+    for (_, seed, record), vector in zip(batch.jobs, batch.vectors):
+        record["embedding"] = vector if vector is not None else _fallback_vector(seed)
+        yield record
+
+
+def _write_records(records: Iterable[Dict[str, Any]], path: Path) -> Iterator[Dict[str, Any]]:
+    """Write ``records`` to ``path`` as a JSON array, yielding each one after it is written."""
+
+    with _open_file(path, "wb") as handle:
+        handle.write(b"[")
+        for idx, record in enumerate(records):
+            if idx:
+                handle.write(b",\n")
+            handle.write(_dumps(record))
+            yield record
+        handle.write(b"]")
+
+
+def _write_binary_records(
+    records: Iterable[Dict[str, Any]],
+    path: Path,
+    *,
+    count: int,
+) -> Iterator[Dict[str, Any]]:
+    """Write metadata as JSON and vectors as a float16 ``.npy`` sidecar next to ``path``.
+
+    Yields each record after it is written, like :func:`_write_records`.
+    """
+
+    meta_path, ids_path, vectors_path = _binary_paths(path)
+    vectors = np.lib.format.open_memmap(
+        vectors_path, mode="w+", dtype=np.float16, shape=(count, EMBEDDING_DIM)
+    )
+    ids: list[str] = []
+    with meta_path.open("wb") as handle:
+        handle.write(b"[")
+        for idx, record in enumerate(records):
+            if idx:
+                handle.write(b",\n")
+            handle.write(_dumps({"id": record["id"], "metadata": record["metadata"]}))
+            vectors[idx] = record["embedding"]
+            ids.append(record["id"])
+            yield record
+        handle.write(b"]")
+    vectors.flush()
+    del vectors
+    ids_path.write_bytes(_dumps(ids))
+
+
+def load_embeddings(path: str | Path) -> Tuple[List[str], Any]:
+    """Return ``(ids, vectors)`` for a binary embeddings output.
+
+    ``path`` may be the ``.meta.json`` file returned by
+    ``generate_embeddings(..., binary=True)`` or the JSON path it was given.
+    Vectors are memory-mapped read-only, one float16 row per id.
+    """
+
+    if np is None:
+        raise RuntimeError("numpy package is not installed")
+
+    _, ids_path, vectors_path = _binary_paths(Path(path))
+    with ids_path.open("rb") as handle:
+        ids = json.load(handle)
+    return ids, np.load(vectors_path, mmap_mode="r")
+
+
+def _binary_paths(path: Path) -> Tuple[Path, Path, Path]:
+    stem = path.name
+    for suffix in (".meta.json", ".json.gz", ".json"):
+        if stem.endswith(suffix):
+            stem = stem[: -len(suffix)]
+            break
+    return (
+        path.with_name(f"{stem}.meta.json"),
+        path.with_name(f"{stem}.ids.json"),
+        path.with_name(f"{stem}.vecs.f16.npy"),
     )
 
 
-def _generate_vector(text: str, *, seed: str, use_llm: bool) -> List[float]:
-    text = text or ""
-    if use_llm:
+def _dumps(record: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(record)
+    return json.dumps(record).encode("utf-8")
+
+
+def _openai_client() -> Any:
+    """Return the process-wide OpenAI client, creating it on first use."""
+
+    global _CLIENT
+    with _CLIENT_LOCK:
+        if _CLIENT is not None:
+            return _CLIENT
         try:  # pragma: no cover - network dependency
             import openai
 
             api_key = os.getenv("OPENAI_API_KEY")
             if not api_key:
                 raise RuntimeError("OPENAI_API_KEY not set")
-
-            client = openai.OpenAI(api_key=api_key)
-            response = client.embeddings.create(
-                model="text-embedding-3-small",
-                input=text,
-            )
-            return response.data[0].embedding
+            _CLIENT = openai.OpenAI(api_key=api_key, http_client=_http_client())
         except Exception as exc:  # pragma: no cover
             print(f"[embedder] OpenAI embedding failed ({exc}); using fallback")
+            return None
+        return _CLIENT
+
+
+def _http_client() -> Any:
+    """Pooled keep-alive transport for the OpenAI client; HTTP/2 when ``h2`` is installed."""
+
+    import httpx
+
+    try:  # pragma: no cover - optional dependency
+        import h2  # noqa: F401
 
-    rng = random.Random(hash(seed) % 1_000_000)
+        http2 = True
+    except ImportError:  # pragma: no cover - HTTP/1.1 keep-alive only
+        http2 = False
+
+    return httpx.Client(
+        http2=http2,
+        timeout=30,
+        limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+    )
+
+
+def _fallback_vector(seed: str) -> List[float]:
+    seed_value = _seed_int(seed)
+    if np is not None:
+        # Legacy RandomState is MT19937 seeded through init_by_array with the same
+        # 32-bit key words as random.Random, and draws uniforms the same way, so
+        # both paths return identical vectors for a seed.
+        key = np.array([seed_value & 0xFFFFFFFF, seed_value >> 32], dtype=np.uint32)
+        return np.random.RandomState(key).uniform(-1.0, 1.0, EMBEDDING_DIM).tolist()
+    rng = random.Random(seed_value)
     return [rng.uniform(-1.0, 1.0) for _ in range(EMBEDDING_DIM)]
 
 
+def _seed_int(seed: str) -> int:
+    # builtin hash() is salted per process; blake2b keeps vectors stable across runs.
+    # The top bit keeps the seed two 32-bit words long, the key numpy is given above.
+    digest = hashlib.blake2b(seed.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little") | (1 << 63)
+
+
 def _persist_to_pinecone(
     vectors: Iterable[Dict[str, Any]],
     pinecone_config: Dict[str, Any],
@@ -250,57 +553,78 @@ def _persist_to_pinecone(
         host=pinecone_config.get("host"),
     )
 
-    processed = 0
-    vectors_list = list(vectors)
-    batch_size = 50
+    # Records have already been written to disk, so their metadata is
+    # extended in place rather than copied per record.
+    jurisdiction_items = [
+        (f"jurisdiction_{key}", value)
+        for key, value in (extra_metadata or {}).items()
+        if value is not None
+    ]
 
     try:
-        for start in range(0, len(vectors_list), batch_size):
-            batch = vectors_list[start:start + batch_size]
-            pinecone_records = []
-            for record in batch:
-                metadata = dict(record.get("metadata", {}))
-                if extra_metadata:
-                    for key, value in extra_metadata.items():
-                        if value is not None:
-                            metadata[f"jurisdiction_{key}"] = value
-
-                pinecone_records.append(
-                    {
-                        "id": str(record["id"]),
-                        "values": record.get("embedding", []),
-                        "metadata": metadata,
-                    }
-                )
-
-            processed += store.upsert_embeddings(pinecone_records, namespace=namespace)
-
+        processed = store.upsert_embeddings(
+            _pinecone_records(vectors, jurisdiction_items),
+            namespace=namespace,
+        )
         print(f"[embedder] Upserted {processed} vectors to Pinecone index '{store.index_name}'")
-    except Exception as exc:  # pragma: no cover - network failure
+    except _RecordSourceError as exc:
+        # The embedder or the disk writer feeding the upsert failed; that is not
+        # a Pinecone problem and must not be reported (or swallowed) as one.
+        raise exc.__cause__ from None
+    except Exception as exc:
         print(f"[embedder] Unable to persist embeddings to Pinecone: {exc}")
 
 
+class _RecordSourceError(Exception):
+    """Raised through the Pinecone upsert when producing the next record failed."""
+
+
+def _pinecone_records(
+    vectors: Iterable[Dict[str, Any]],
+    jurisdiction_items: List[Tuple[str, Any]],
+) -> Iterator[Dict[str, Any]]:
+    iterator = iter(vectors)
+    while True:
+        try:
+            record = next(iterator)
+        except StopIteration:
+            return
+        except Exception as exc:
+            raise _RecordSourceError(exc) from exc
+        metadata = record.setdefault("metadata", {})
+        metadata.update(jurisdiction_items)
+        yield {
+            "id": str(record["id"]),
+            "values": record.get("embedding", []),
+            "metadata": metadata,
+        }
+
+
 def _compose_decision_blob(decision_point: Dict[str, Any]) -> str:
     rad_id = decision_point.get("rad_id", "RAD")
     rad_text = decision_point.get("rad_text", "")
 
-    po_lines = [
-        f"{detail.get('po_id', '')}: {detail.get('text', '').strip()}"
-        for detail in decision_point.get("po_details", [])
-        if detail.get("text")
-    ]
-    ead_lines = [
-        f"{detail.get('ead_id', '')}: {detail.get('text', '').strip()}"
-        for detail in decision_point.get("ead_details", [])
-        if detail.get("text")
-    ]
-
-    parts = [f"{rad_id}: {rad_text}".strip()]
-    if po_lines:
-        parts.append("POs:\n" + "\n".join(po_lines))
-    if ead_lines:
-        parts.append("EADs:\n" + "\n".join(ead_lines))
-    return "\n\n".join(filter(None, parts))
+    # One flat list of lines; an empty entry yields the blank line between blocks.
+    lines: list[str] = []
+    heading = f"{rad_id}: {rad_text}".strip()
+    if heading:
+        lines.append(heading)
+    for label, id_key, details in (
+        ("POs:", "po_id", decision_point.get("po_details", [])),
+        ("EADs:", "ead_id", decision_point.get("ead_details", [])),
+    ):
+        block_started = False
+        for detail in details:
+            text = detail.get("text")
+            if not text:
+                continue
+            if not block_started:
+                if lines:
+                    lines.append("")
+                lines.append(label)
+                block_started = True
+            lines.append(f"{detail.get(id_key, '')}: {text.strip()}")
+    return "\n".join(lines)
 
 
 def _compose_po_blob(detail: Dict[str, Any], decision_point: Dict[str, Any]) -> str:
@@ -320,12 +644,16 @@ def _resolve_page_span(source_refs: List[Dict[str, Any]]) -> Optional[List[Any]]
     return None
 
 
-def _vector_id(city: str, version: str, identifier: str) -> str:
-    return f"{_slug(city)}_{version}_{identifier}".replace(" ", "")
+def _vector_id_prefix(city: str, version: str) -> str:
+    return f"{_slug(city)}_{version}_".replace(" ", "")
+
+
+def _vector_id(id_prefix: str, identifier: str) -> str:
+    return id_prefix + identifier.replace(" ", "")
 
 
 def _slug(value: str) -> str:
     return value.replace(" ", "")
 
 
-__all__ = ["generate_embeddings"]
+__all__ = ["generate_embeddings", "load_embeddings"]
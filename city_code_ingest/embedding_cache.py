@@ -0,0 +1,109 @@
+"""SQLite-backed cache of embedding vectors keyed by content hash."""
+
+from __future__ import annotations
+
+import array
+import hashlib
+import logging
+import sqlite3
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+
+DEFAULT_CACHE_PATH = Path.home() / ".cache" / "city_code_ingest" / "embeddings.sqlite"
+
+# Stay well below SQLite's bound-parameter limit for IN (...) lookups.
+_LOOKUP_CHUNK = 500
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class EmbeddingCache:
+    """Best-effort cache: any filesystem or SQLite error disables it for the rest of the run."""
+
+    path: Path = DEFAULT_CACHE_PATH
+
+    _connection: Optional[sqlite3.Connection] = None
+    _disabled: bool = False
+
+    @staticmethod
+    def key(model: str, text: str) -> bytes:
+        """Hash ``text`` after collapsing whitespace and case so trivial edits still hit."""
+
+        normalized = " ".join(text.lower().split())
+        return hashlib.sha256(f"{model}|{normalized}".encode("utf-8")).digest()
+
+    def _disable(self, exc: Exception) -> None:
+        logger.warning("[embedding_cache] Disabling embedding cache at %s: %s", self.path, exc)
+        self._disabled = True
+        self.close()
+
+    def _ensure_connection(self) -> sqlite3.Connection:
+        if self._connection is not None:
+            return self._connection
+
+        path = Path(self.path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(path)
+        try:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings ("
+                "hash BLOB PRIMARY KEY, model TEXT NOT NULL, dim INTEGER NOT NULL, vec BLOB NOT NULL)"
+            )
+        except sqlite3.Error:
+            connection.close()
+            raise
+        self._connection = connection
+        return connection
+
+    def get(self, key: bytes) -> Optional[List[float]]:
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys: Sequence[bytes]) -> Dict[bytes, List[float]]:
+        found: dict[bytes, List[float]] = {}
+        if self._disabled:
+            return found
+        try:
+            connection = self._ensure_connection()
+            for start in range(0, len(keys), _LOOKUP_CHUNK):
+                chunk = keys[start:start + _LOOKUP_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                rows = connection.execute(
+                    f"SELECT hash, vec FROM embeddings WHERE hash IN ({placeholders})",
+                    chunk,
+                )
+                for key, blob in rows:
+                    found[key] = array.array("d", blob).tolist()
+        except (OSError, sqlite3.Error) as exc:
+            self._disable(exc)
+            return {}
+        return found
+
+    def put(self, key: bytes, vector: Sequence[float], *, model: str) -> None:
+        self.put_many([(key, vector)], model=model)
+
+    def put_many(self, entries: Iterable[Tuple[bytes, Sequence[float]]], *, model: str) -> None:
+        if self._disabled:
+            return
+        try:
+            connection = self._ensure_connection()
+            with connection:
+                connection.executemany(
+                    "INSERT OR REPLACE INTO embeddings (hash, model, dim, vec) VALUES (?, ?, ?, ?)",
+                    ((key, model, len(vector), array.array("d", vector).tobytes()) for key, vector in entries),
+                )
+        except (OSError, sqlite3.Error) as exc:
+            self._disable(exc)
+
+    def close(self) -> None:
+        connection, self._connection = self._connection, None
+        if connection is not None:
+            try:
+                connection.close()
+            except sqlite3.Error:  # pragma: no cover - nothing left to salvage
+                pass
+
+
+__all__ = ["EmbeddingCache", "DEFAULT_CACHE_PATH"]
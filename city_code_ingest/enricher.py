@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 
@@ -24,6 +25,9 @@ DOCUMENT_KEYWORDS = {
     "permit": "Permit Certificate",
 }
 
+SECTION_REF_PATTERN = re.compile(r"section\s+(\d{1,2}\.\d{1,2}\.\d{1,3})")
+EFFECTIVE_DATE_PATTERN = re.compile(r"effective\s+(?P<date>[a-z]+\s+\d{4})")
+
 
 def add_metadata(sections: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """Attach mock topics, references, and required documents."""
@@ -34,10 +38,10 @@ def add_metadata(sections: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         combined_text = " ".join([section.get("heading", ""), section.get("body", "")]).lower()
 
         topics = sorted({label for keyword, label in TOPIC_KEYWORDS.items() if keyword in combined_text})
-        references = sorted({f"Section {match}" for match in re.findall(r"section\s+(\d{1,2}\.\d{1,2}\.\d{1,3})", combined_text)})
+        references = sorted({f"Section {match}" for match in SECTION_REF_PATTERN.findall(combined_text)})
         required_docs = list({label for keyword, label in DOCUMENT_KEYWORDS.items() if keyword in combined_text})
 
-        effective_date_match = re.search(r"effective\s+(?P<date>[a-z]+\s+\d{4})", combined_text)
+        effective_date_match = EFFECTIVE_DATE_PATTERN.search(combined_text)
         effective_date = effective_date_match.group("date").title() if effective_date_match else ""
 
         enriched_section = dict(section)
@@ -68,6 +72,13 @@ __all__ = ["add_metadata"]
 QUESTION_PATTERN = re.compile(r"^(?:ead\s+)?question[:\-]\s*(?P<body>.+)$", re.IGNORECASE)
 RAD_PATTERN = re.compile(r"^RAD\d+\b", re.IGNORECASE)
 PO_PATTERN = re.compile(r"^PO\d+", re.IGNORECASE)
+RAD_LABEL_PATTERN = re.compile(r"^(RAD\d+)(?:[:.\-]\s*|\s+)?(.*)$", re.IGNORECASE)
+PO_LABEL_PATTERN = re.compile(r"^(PO[\d,\s\-–]+)(?:[:.\-]\s*|\s+)?(.*)$", re.IGNORECASE)
+YES_NO_PATTERN = re.compile(r"\b(?:yes|no)\b", re.IGNORECASE)
+PO_SEPARATOR_PATTERN = re.compile(r",\s*")
+DIGITS_PATTERN = re.compile(r"\d+")
+# Page furniture that repeats inside the RAD/PO correspondence table.
+TABLE_SKIP_PREFIXES = ("effective", "moreton", "9 development")
 
 
 def _extract_decision_points(
@@ -91,6 +102,7 @@ def _extract_decision_points(
     return _extract_simple_questions(lines, section, references, breadcrumb)
 
 
+@lru_cache(maxsize=4096)
 def _normalize_question(line: str) -> str:
     match = QUESTION_PATTERN.match(line)
     if match:
@@ -110,7 +122,7 @@ def _ensure_question_suffix(text: str) -> str:
 
 
 def _infer_response_options(line: str) -> List[str]:
-    if re.search(r"\byes\b", line, re.IGNORECASE) or re.search(r"\bno\b", line, re.IGNORECASE):
+    if YES_NO_PATTERN.search(line):
         return ["Yes", "No"]
     return ["Yes", "No"]
 
@@ -145,12 +157,8 @@ def _extract_simple_questions(
 
 
 def _extract_rad_po_decision_points(lines: List[str]) -> List[Dict[str, Any]]:
-    rad_po_map = _build_rad_po_mapping(lines)
-    if not rad_po_map:
-        # Still attempt to extract RAD text even if table not found; there may still be RAD blocks
-        rad_po_map = {}
-
-    rad_texts, po_texts, rad_context = _collect_rad_po_texts(lines)
+    # An empty mapping still lets RAD blocks through when the correspondence table is missing.
+    rad_po_map, rad_texts, po_texts, rad_context = _scan_rad_po_lines(lines)
     if not rad_texts:
         return []
 
@@ -175,53 +183,20 @@ def _extract_rad_po_decision_points(lines: List[str]) -> List[Dict[str, Any]]:
     return decision_points
 
 
-def _build_rad_po_mapping(lines: List[str]) -> Dict[str, List[str]]:
+def _scan_rad_po_lines(
+    lines: List[str],
+) -> tuple[Dict[str, List[str]], Dict[str, str], Dict[str, str], Dict[str, str]]:
+    """Collect the RAD -> PO table mapping and the RAD/PO label texts in one pass.
+
+    Returns ``(mapping, rad_texts, po_texts, rad_context)``.
+    """
+
     mapping: dict[str, list[str]] = {}
     last_po: Optional[List[str]] = None
     in_table = False
+    table_done = False
     blank_streak = 0
 
-    for line in lines:
-        stripped = line.strip()
-        if not stripped:
-            if in_table:
-                blank_streak += 1
-                if blank_streak > 4:
-                    break
-            continue
-
-        lowered = stripped.lower()
-        if "corresponding po" in lowered:
-            in_table = True
-            blank_streak = 0
-            continue
-
-        if not in_table:
-            continue
-
-        blank_streak = 0
-        if lowered.startswith("effective") or lowered.startswith("moreton") or lowered.startswith("9 development"):
-            continue
-
-        if lowered.startswith("where accepted"):
-            break
-
-        if lowered.startswith("po"):
-            last_po = _expand_po_tokens(stripped)
-            continue
-
-        if lowered.startswith("rad"):
-            rad_id = stripped.split()[0].upper()
-            if last_po is None:
-                mapping.setdefault(rad_id, [])
-            else:
-                mapping[rad_id] = list(dict.fromkeys(last_po))
-            continue
-
-    return mapping
-
-
-def _collect_rad_po_texts(lines: List[str]) -> tuple[Dict[str, str], Dict[str, str], Dict[str, str]]:
     rad_texts: dict[str, str] = {}
     po_texts: dict[str, str] = {}
     rad_context: dict[str, str] = {}
@@ -233,6 +208,36 @@ def _collect_rad_po_texts(lines: List[str]) -> tuple[Dict[str, str], Dict[str, s
 
     for line in lines:
         stripped = line.strip()
+
+        # RAD -> PO correspondence table.
+        if table_done:
+            pass
+        elif not stripped:
+            if in_table:
+                blank_streak += 1
+                if blank_streak > 4:
+                    table_done = True
+        else:
+            lowered = stripped.lower()
+            if "corresponding po" in lowered:
+                in_table = True
+                blank_streak = 0
+            elif in_table:
+                blank_streak = 0
+                if lowered.startswith(TABLE_SKIP_PREFIXES):
+                    pass
+                elif lowered.startswith("where accepted"):
+                    table_done = True
+                elif lowered.startswith("po"):
+                    last_po = _expand_po_tokens(stripped)
+                elif lowered.startswith("rad"):
+                    rad_id = stripped.split()[0].upper()
+                    if last_po is None:
+                        mapping.setdefault(rad_id, [])
+                    else:
+                        mapping[rad_id] = list(dict.fromkeys(last_po))
+
+        # RAD/PO label blocks.
         if not stripped and not current_type:
             continue
 
@@ -262,7 +267,7 @@ def _collect_rad_po_texts(lines: List[str]) -> tuple[Dict[str, str], Dict[str, s
     if current_type and current_labels:
         _flush_label_buffer(current_type, current_labels, buffer, rad_texts, po_texts)
 
-    return rad_texts, po_texts, rad_context
+    return mapping, rad_texts, po_texts, rad_context
 
 
 def _flush_label_buffer(
@@ -284,11 +289,11 @@ def _flush_label_buffer(
 
 
 def _match_label_line(line: str) -> Optional[tuple[str, List[str], str]]:
-    rad_match = re.match(r"^(RAD\d+)(?:[:.\-]\s*|\s+)?(.*)$", line, re.IGNORECASE)
+    rad_match = RAD_LABEL_PATTERN.match(line)
     if rad_match:
         return "RAD", [rad_match.group(1).upper()], rad_match.group(2)
 
-    po_match = re.match(r"^(PO[\d,\s\-–]+)(?:[:.\-]\s*|\s+)?(.*)$", line, re.IGNORECASE)
+    po_match = PO_LABEL_PATTERN.match(line)
     if po_match:
         labels = _expand_po_tokens(po_match.group(1))
         remainder = po_match.group(2)
@@ -300,7 +305,7 @@ def _match_label_line(line: str) -> Optional[tuple[str, List[str], str]]:
 def _expand_po_tokens(token_str: str) -> List[str]:
     token_str = token_str.replace("–", "-")
     tokens: list[str] = []
-    for part in re.split(r",\s*", token_str):
+    for part in PO_SEPARATOR_PATTERN.split(token_str):
         part = part.strip()
         if not part:
             continue
@@ -320,7 +325,7 @@ def _expand_po_tokens(token_str: str) -> List[str]:
 
 
 def _extract_digits(value: str) -> Optional[int]:
-    match = re.search(r"\d+", value)
+    match = DIGITS_PATTERN.search(value)
     if not match:
         return None
     return int(match.group())
@@ -337,5 +342,5 @@ def _format_rad_question(rad_id: str, rad_body: str, context: Optional[str]) ->
 
 
 def _rad_sort_key(rad_id: str) -> int:
-    match = re.search(r"\d+", rad_id)
+    match = DIGITS_PATTERN.search(rad_id)
     return int(match.group()) if match else 0
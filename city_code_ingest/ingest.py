@@ -2,67 +2,136 @@
 
 from __future__ import annotations
 
-import io
-from dataclasses import dataclass, field
+import hashlib
+import json
+import logging
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
 from html.parser import HTMLParser
+from importlib import metadata
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+try:  # pragma: no cover - optional dependency
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # pragma: no cover - try lxml next
+    LexborHTMLParser = None  # type: ignore
+
+try:  # pragma: no cover - optional dependency
+    import lxml.html as lxml_html
+except ImportError:  # pragma: no cover - fall back to html.parser
+    lxml_html = None  # type: ignore
+
+
+logger = logging.getLogger(__name__)
+
+# Pages handed to each PDF text worker; large enough to amortise opening the file per task.
+PDF_PAGE_CHUNK = 10
+DEFAULT_PDF_WORKERS = min(os.cpu_count() or 1, 4)
+# Bump when extraction output changes so existing cache entries stop matching.
+INGEST_CACHE_VERSION = 2
+# Installed versions of these are part of the cache key.
+_BACKEND_DISTRIBUTIONS = ("pymupdf", "pdfplumber", "selectolax", "lxml")
 
 
-@dataclass
 class _HTMLTextExtractor(HTMLParser):
     """Lightweight HTML parser that collects visible text."""
 
-    buffer: io.StringIO = field(default_factory=io.StringIO)
+    def __init__(self) -> None:
+        super().__init__()
+        self._parts: list[str] = []
 
     def handle_data(self, data: str) -> None:  # pragma: no cover - simple passthrough
-        self.buffer.write(data)
+        self._parts.append(data)
 
     def get_text(self) -> str:
-        return self.buffer.getvalue()
+        return "".join(self._parts)
 
 
-def extract_text(file_path: str) -> List[str]:
+def extract_text(
+    file_path: str,
+    *,
+    num_workers: int = DEFAULT_PDF_WORKERS,
+    cache_dir: str | Path | None = None,
+) -> List[str]:
     """Extract plain text lines from a PDF or HTML file.
 
     Falls back to a stub implementation if optional PDF libraries are missing.
+    PyMuPDF page ranges are extracted in ``num_workers`` processes for larger PDFs.
+    With ``cache_dir``, results from the primary extractor are cached there by file content.
     """
 
-    path = Path(file_path)
-    if not path.exists():
-        raise FileNotFoundError(f"Input file not found: {file_path}")
+    path, ext = _resolve_source(file_path)
+    lines, _ = _load_text(path, ext, num_workers=num_workers, cache_prefix=_cache_prefix(cache_dir, path))
+    return lines
+
+
+def _load_text(
+    path: Path,
+    ext: str,
+    *,
+    num_workers: int,
+    cache_prefix: Optional[Path],
+) -> tuple[List[str], Optional[str]]:
+    """Return the document's lines and the backend that produced them.
 
-    print(f"[ingest] Extracting text from {path}")
-    ext = path.suffix.lower()
+    The backend is ``None`` when a fallback ran because the primary extractor failed;
+    those results are not cached, so the next run tries the extractor again.
+    """
+
+    cache_file = _cache_file(cache_prefix, "lines")
+    cached = _read_cache(cache_file)
+    if cached is not None:
+        logger.info("[ingest] Loaded cached text for %s", path)
+        return cached["data"], cached["backend"]
+
+    lines, backend = _extract_text(path, ext, num_workers=num_workers)
+    if backend is not None:
+        _write_cache(cache_file, {"backend": backend, "data": lines})
+    return lines, backend
+
+
+def _extract_text(path: Path, ext: str, *, num_workers: int) -> tuple[List[str], Optional[str]]:
+    logger.info("[ingest] Extracting text from %s", path)
 
     if ext == ".pdf":
-        return _extract_pdf(path)
+        return _extract_pdf(path, num_workers=num_workers)
     if ext in {".html", ".htm"}:
         return _extract_html(path)
 
-    print("[ingest] Unrecognized extension, treating as plain text")
-    return _extract_plain_text(path)
+    logger.info("[ingest] Unrecognized extension, treating as plain text")
+    return _extract_plain_text(path), "text"
 
 
-def _extract_pdf(path: Path) -> List[str]:
+def _extract_pdf(path: Path, *, num_workers: int = 1) -> tuple[List[str], Optional[str]]:
     try:
         import fitz  # type: ignore
 
         lines: list[str] = []
         try:
             with fitz.open(path) as doc:
-                for page in doc:
-                    page_text = page.get_text("text") or ""
-                    lines.extend(_normalize_lines(page_text.splitlines()))
+                page_count = doc.page_count
+            starts = range(0, page_count, PDF_PAGE_CHUNK)
+            workers = min(num_workers, len(starts))
+            if workers <= 1:
+                lines = _extract_pdf_page_range(path, 0, page_count)
+            else:
+                ends = [min(start + PDF_PAGE_CHUNK, page_count) for start in starts]
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    for chunk in executor.map(_extract_pdf_page_range, [path] * len(starts), starts, ends):
+                        lines.extend(chunk)
         except Exception as exc:  # pragma: no cover - depends on pymupdf availability
-            print(f"[ingest] PyMuPDF failed to read file ({exc}); using binary fallback")
-            return _extract_plain_text(path)
+            logger.warning("[ingest] PyMuPDF failed to read file (%s); using binary fallback", exc)
+            return _extract_plain_text(path), None
         if not lines:
-            print("[ingest] PyMuPDF returned no text; using binary fallback")
-            return _extract_plain_text(path)
-        return lines
+            logger.warning("[ingest] PyMuPDF returned no text; using binary fallback")
+            return _extract_plain_text(path), None
+        return lines, "pymupdf"
     except ImportError:
-        print("[ingest] PyMuPDF not available; attempting pdfplumber")
+        logger.info("[ingest] PyMuPDF not available; attempting pdfplumber")
 
     try:
         import pdfplumber  # type: ignore
@@ -73,74 +142,146 @@ def _extract_pdf(path: Path) -> List[str]:
                 page_text = page.extract_text() or ""
                 lines.extend(_normalize_lines(page_text.splitlines()))
         if not lines:
-            print("[ingest] pdfplumber returned no text; using binary fallback")
-            return _extract_plain_text(path)
-        return lines
+            logger.warning("[ingest] pdfplumber returned no text; using binary fallback")
+            return _extract_plain_text(path), None
+        return lines, "pdfplumber"
     except ImportError:
-        print("[ingest] pdfplumber not available; evaluating fallback")
+        logger.info("[ingest] pdfplumber not available; evaluating fallback")
 
-    with path.open("rb") as handle:
-        header = handle.read(5)
-        handle.seek(0)
-        if header.startswith(b"%PDF"):
+    with _map_file(path) as raw_bytes:
+        if raw_bytes[:4] == b"%PDF":
             raise RuntimeError(
                 "PDF parsing requires PyMuPDF (pymupdf) or pdfplumber. Install one of them to continue."
             )
-    print("[ingest] Treating PDF as plain text (non-binary content)")
-    return _extract_plain_text(path)
+        logger.info("[ingest] Treating PDF as plain text (non-binary content)")
+        return _decode_lines(raw_bytes), None
+
+
+def _extract_pdf_page_range(path: Path, start: int, end: int) -> List[str]:
+    """Return normalized lines for pages ``start:end``; runs inside PDF worker processes."""
+
+    import fitz  # type: ignore
+
+    lines: list[str] = []
+    with fitz.open(path) as doc:
+        for page_number in range(start, end):
+            page_text = doc[page_number].get_text("text") or ""
+            lines.extend(_normalize_lines(page_text.splitlines()))
+    return lines
 
 
-def _extract_html(path: Path) -> List[str]:
+def _extract_html(path: Path) -> tuple[List[str], Optional[str]]:
+    text = _html_text(path.read_bytes())
+    return _normalize_lines(text.splitlines()), "html"
+
+
+def _html_text(raw_html: bytes) -> str:
+    """Concatenate every text node in UTF-8 ``raw_html``, preferring a native-code parser."""
+
+    html_content = raw_html.decode("utf-8")
+    if LexborHTMLParser is not None:
+        root = LexborHTMLParser(html_content).root
+        return root.text(deep=True, separator="") if root is not None else ""
+
+    if lxml_html is not None and html_content.strip():
+        # lxml rejects str input carrying an XML encoding declaration (XHTML), and
+        # guesses Latin-1 for bytes unless told the encoding.
+        parser = lxml_html.HTMLParser(encoding="utf-8")
+        return lxml_html.document_fromstring(raw_html, parser=parser).text_content()
+
     parser = _HTMLTextExtractor()
-    with path.open("r", encoding="utf-8") as handle:
-        html_content = handle.read()
     parser.feed(html_content)
-    text = parser.get_text()
-    return _normalize_lines(text.splitlines())
+    parser.close()
+    return parser.get_text()
 
 
 def _extract_plain_text(path: Path) -> List[str]:
+    with _map_file(path) as raw_bytes:
+        return _decode_lines(raw_bytes)
+
+
+@contextmanager
+def _map_file(path: Path) -> Iterator[Any]:
+    """Yield the file's bytes as a read-only mmap, or as ``bytes`` where mapping is unavailable."""
+
     with path.open("rb") as handle:
-        raw_bytes = handle.read()
-    decoded = raw_bytes.decode("utf-8", errors="ignore")
+        try:
+            mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):  # empty files and non-mappable streams
+            yield handle.read()
+            return
+        with mapped:
+            yield mapped
+
+
+def _decode_lines(raw_bytes: Any) -> List[str]:
+    # str() decodes straight from the buffer, so an mmap is never copied into a bytes object.
+    decoded = str(raw_bytes, "utf-8", "ignore")
     return _normalize_lines(decoded.splitlines())
 
 
 def _normalize_lines(lines: Iterable[str]) -> List[str]:
-    normalized: list[str] = []
-    for line in lines:
-        stripped = line.strip()
-        if stripped:
-            normalized.append(stripped)
+    normalized = [stripped for line in lines if (stripped := line.strip())]
     if not normalized:
-        print("[ingest] Warning: no textual content found after normalization")
+        logger.debug("[ingest] No textual content found after normalization")
     return normalized
 
 
-def extract_document(file_path: str) -> Dict[str, object]:
+def extract_document(
+    file_path: str,
+    *,
+    num_workers: int = DEFAULT_PDF_WORKERS,
+    cache_dir: str | Path | None = None,
+) -> Dict[str, object]:
     """Return both normalized lines and layout information for a document."""
 
-    lines = extract_text(file_path)
-    layout = extract_layout(file_path)
+    path, ext = _resolve_source(file_path)
+    cache_prefix = _cache_prefix(cache_dir, path)
+    lines, _ = _load_text(path, ext, num_workers=num_workers, cache_prefix=cache_prefix)
+    layout = _load_layout(path, ext, num_workers=num_workers, cache_prefix=cache_prefix)
     return {
         "lines": lines,
         "layout": layout,
     }
 
 
-def extract_layout(file_path: str) -> Dict[str, object]:
-    path = Path(file_path)
-    if not path.exists():
-        raise FileNotFoundError(f"Input file not found: {file_path}")
-
-    ext = path.suffix.lower()
+def extract_layout(
+    file_path: str,
+    *,
+    num_workers: int = DEFAULT_PDF_WORKERS,
+    cache_dir: str | Path | None = None,
+) -> Dict[str, object]:
+    path, ext = _resolve_source(file_path)
+    return _load_layout(path, ext, num_workers=num_workers, cache_prefix=_cache_prefix(cache_dir, path))
+
+
+def _load_layout(path: Path, ext: str, *, num_workers: int, cache_prefix: Optional[Path]) -> Dict[str, object]:
+    cache_file = _cache_file(cache_prefix, "layout")
+    cached = _read_cache(cache_file)
+    if cached is not None:
+        logger.info("[ingest] Loaded cached layout for %s", path)
+        return cached["data"]
+
+    layout, backend = _extract_layout(path, ext, num_workers=num_workers, cache_prefix=cache_prefix)
+    if backend is not None:
+        _write_cache(cache_file, {"backend": backend, "data": layout})
+    return layout
+
+
+def _extract_layout(
+    path: Path,
+    ext: str,
+    *,
+    num_workers: int,
+    cache_prefix: Optional[Path],
+) -> tuple[Dict[str, object], Optional[str]]:
     if ext == ".pdf":
-        layout = _extract_pdf_layout(path)
-        if layout:
-            return layout
+        extracted = _extract_pdf_layout(path, num_workers=num_workers)
+        if extracted is not None:
+            return extracted
 
     # Treat everything else as plain text layout fallback
-    lines = extract_text(file_path)
+    lines, text_backend = _load_text(path, ext, num_workers=num_workers, cache_prefix=cache_prefix)
     blocks = []
     for idx, line in enumerate(lines):
         blocks.append(
@@ -152,7 +293,7 @@ def extract_layout(file_path: str) -> Dict[str, object]:
                 "bbox": [0.0, float(idx), 0.0, float(idx + 1)],
             }
         )
-    return {
+    layout = {
         "pages": [
             {
                 "page_number": 1,
@@ -160,66 +301,47 @@ def extract_layout(file_path: str) -> Dict[str, object]:
             }
         ]
     }
+    # A PDF only gets here when both layout backends failed.
+    if ext == ".pdf" or text_backend is None:
+        return layout, None
+    return layout, text_backend
+
 
+def _extract_pdf_layout(
+    path: Path,
+    *,
+    num_workers: int = 1,
+) -> Optional[tuple[Dict[str, object], Optional[str]]]:
+    """Return the layout and its backend, or ``None`` when no backend could read ``path``.
 
-def _extract_pdf_layout(path: Path) -> Optional[Dict[str, object]]:
+    The backend is ``None`` when PyMuPDF stood in for a pdfplumber failure.
+    """
+
+    fitz_backend: Optional[str] = "pymupdf"
     try:
         import pdfplumber  # type: ignore
 
-        pages: list[dict[str, object]] = []
         with pdfplumber.open(path) as pdf:
-            for page in pdf.pages:
-                blocks: list[dict[str, object]] = []
-                text_chunks = page.extract_words(use_text_flow=True, keep_blank_chars=False)
-                if text_chunks:
-                    for idx, chunk in enumerate(text_chunks):
-                        chunk_text = chunk.get("text", "").strip()
-                        if not chunk_text:
-                            continue
-                        bbox = [
-                            float(chunk.get("x0", 0.0)),
-                            float(chunk.get("top", 0.0)),
-                            float(chunk.get("x1", 0.0)),
-                            float(chunk.get("bottom", 0.0)),
-                        ]
-                        blocks.append(
-                            {
-                                "id": f"p{page.page_number}-w{idx}",
-                                "text": chunk_text,
-                                "page": page.page_number,
-                                "span": [idx, idx + len(chunk_text)],
-                                "bbox": bbox,
-                            }
-                        )
-                else:
-                    # Fallback to raw text if words not available
-                    page_text = page.extract_text() or ""
-                    for idx, line in enumerate(page_text.splitlines()):
-                        cleaned = line.strip()
-                        if not cleaned:
-                            continue
-                        blocks.append(
-                            {
-                                "id": f"p{page.page_number}-l{idx}",
-                                "text": cleaned,
-                                "page": page.page_number,
-                                "span": [idx, idx + 1],
-                                "bbox": [0.0, float(idx), 0.0, float(idx + 1)],
-                            }
-                        )
-
-                pages.append(
-                    {
-                        "page_number": page.page_number,
-                        "blocks": blocks,
-                    }
-                )
-
-        return {"pages": pages}
+            page_count = len(pdf.pages)
+        starts = range(0, page_count, PDF_PAGE_CHUNK)
+        workers = min(num_workers, len(starts))
+        if workers <= 1:
+            pages = _extract_pdf_layout_page_range(path, 0, page_count)
+        else:
+            # pdfplumber objects are not thread-safe and pdfminer holds the GIL,
+            # so page ranges go to separate processes that each open the file.
+            pages = []
+            ends = [min(start + PDF_PAGE_CHUNK, page_count) for start in starts]
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                for chunk in executor.map(_extract_pdf_layout_page_range, [path] * len(starts), starts, ends):
+                    pages.extend(chunk)
+
+        return {"pages": pages}, "pdfplumber"
     except ImportError:
         pass
     except Exception as exc:  # pragma: no cover - depends on pdfplumber internals
-        print(f"[ingest] pdfplumber failed to produce layout ({exc}); falling back to text layout")
+        logger.warning("[ingest] pdfplumber failed to produce layout (%s); falling back to text layout", exc)
+        fitz_backend = None
 
     try:
         import fitz  # type: ignore
@@ -246,13 +368,138 @@ def _extract_pdf_layout(path: Path) -> Optional[Dict[str, object]]:
 
                 pages.append({"page_number": page.number + 1, "blocks": blocks})
 
-        return {"pages": pages}
+        return {"pages": pages}, fitz_backend
     except ImportError:
         pass
     except Exception as exc:  # pragma: no cover
-        print(f"[ingest] PyMuPDF layout extraction failed ({exc}); falling back to text layout")
+        logger.warning("[ingest] PyMuPDF layout extraction failed (%s); falling back to text layout", exc)
 
     return None
 
 
+def _extract_pdf_layout_page_range(path: Path, start: int, end: int) -> List[Dict[str, object]]:
+    """Return pdfplumber layout pages ``start:end``; runs inside PDF worker processes."""
+
+    import pdfplumber  # type: ignore
+
+    pages: list[dict[str, object]] = []
+    with pdfplumber.open(path) as pdf:
+        for page in pdf.pages[start:end]:
+            blocks: list[dict[str, object]] = []
+            text_chunks = page.extract_words(use_text_flow=True, keep_blank_chars=False)
+            if text_chunks:
+                for idx, chunk in enumerate(text_chunks):
+                    chunk_text = chunk.get("text", "").strip()
+                    if not chunk_text:
+                        continue
+                    bbox = [
+                        float(chunk.get("x0", 0.0)),
+                        float(chunk.get("top", 0.0)),
+                        float(chunk.get("x1", 0.0)),
+                        float(chunk.get("bottom", 0.0)),
+                    ]
+                    blocks.append(
+                        {
+                            "id": f"p{page.page_number}-w{idx}",
+                            "text": chunk_text,
+                            "page": page.page_number,
+                            "span": [idx, idx + len(chunk_text)],
+                            "bbox": bbox,
+                        }
+                    )
+            else:
+                # Fallback to raw text if words not available
+                page_text = page.extract_text() or ""
+                for idx, line in enumerate(page_text.splitlines()):
+                    cleaned = line.strip()
+                    if not cleaned:
+                        continue
+                    blocks.append(
+                        {
+                            "id": f"p{page.page_number}-l{idx}",
+                            "text": cleaned,
+                            "page": page.page_number,
+                            "span": [idx, idx + 1],
+                            "bbox": [0.0, float(idx), 0.0, float(idx + 1)],
+                        }
+                    )
+
+            pages.append(
+                {
+                    "page_number": page.page_number,
+                    "blocks": blocks,
+                }
+            )
+    return pages
+
+
+def _resolve_source(file_path: str | Path) -> tuple[Path, str]:
+    path = Path(file_path)
+    if not path.exists():
+        raise FileNotFoundError(f"Input file not found: {file_path}")
+    return path, path.suffix.lower()
+
+
+def _cache_prefix(cache_dir: str | Path | None, path: Path) -> Optional[Path]:
+    """Return ``cache_dir/<key>``, the stem shared by a file's cache entries.
+
+    The key covers the file content, ``INGEST_CACHE_VERSION`` and the installed
+    extractor versions, so code changes and library upgrades miss the cache.
+    """
+
+    if cache_dir is None:
+        return None
+    with _map_file(path) as contents:
+        digest = hashlib.blake2b(contents, digest_size=16)
+    digest.update(_extractor_fingerprint().encode("utf-8"))
+    return Path(cache_dir) / digest.hexdigest()
+
+
+@lru_cache(maxsize=1)
+def _extractor_fingerprint() -> str:
+    versions = [f"ingest={INGEST_CACHE_VERSION}"]
+    for distribution in _BACKEND_DISTRIBUTIONS:
+        try:
+            versions.append(f"{distribution}={metadata.version(distribution)}")
+        except metadata.PackageNotFoundError:
+            versions.append(f"{distribution}=-")
+    return ";".join(versions)
+
+
+def _cache_file(cache_prefix: Optional[Path], kind: str) -> Optional[Path]:
+    if cache_prefix is None:
+        return None
+    return cache_prefix.with_name(f"{cache_prefix.name}.{kind}.json")
+
+
+def _read_cache(cache_file: Optional[Path]) -> Optional[Dict[str, Any]]:
+    """Return a ``{"backend", "data"}`` cache entry, or ``None`` on a miss."""
+
+    if cache_file is None or not cache_file.exists():
+        return None
+    try:
+        with cache_file.open("r", encoding="utf-8") as handle:
+            entry = json.load(handle)
+    except (OSError, ValueError) as exc:
+        logger.warning("[ingest] Ignoring unreadable cache entry %s (%s)", cache_file, exc)
+        return None
+    if not isinstance(entry, dict) or not {"backend", "data"} <= entry.keys():
+        logger.warning("[ingest] Ignoring malformed cache entry %s", cache_file)
+        return None
+    return entry
+
+
+def _write_cache(cache_file: Optional[Path], payload: Any) -> None:
+    if cache_file is None:
+        return
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        with tmp_path.open("w", encoding="utf-8") as handle:
+            json.dump(payload, handle)
+        os.replace(tmp_path, cache_file)
+    except OSError as exc:
+        logger.warning("[ingest] Unable to write cache entry %s (%s)", cache_file, exc)
+
+
 __all__ = ["extract_text", "extract_document", "extract_layout"]
@@ -3,28 +3,31 @@
 from __future__ import annotations
 
 import argparse
+import gzip
 import json
+import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, List
 
 from dotenv import load_dotenv
 
-from city_code_ingest import (
-    builder,
-    chunker,
-    embedder,
-    ingest,
-    mapper,
-    schema_extractor,
-    validator,
-)
+try:  # pragma: no cover - optional dependency
+    import orjson
+except ImportError:  # pragma: no cover - fall back to stdlib json
+    orjson = None  # type: ignore
 
+from city_code_ingest.embedding_cache import DEFAULT_CACHE_PATH
+
+
+logger = logging.getLogger(__name__)
 
 MODULE_ROOT = Path(__file__).resolve().parent
 OUTPUT_DIR = MODULE_ROOT / "output"
-
-load_dotenv()
+_WRITE_BUFFER_SIZE = 64 * 1024
+_WRITER_THREADS = 4
+_GZIP_LEVEL = 1
 
 
 def run_pipeline(
@@ -42,68 +45,91 @@ def run_pipeline(
     pinecone_host: str | None = None,
     use_llm: bool = False,
     embed_level: str = "decision_point",
+    embedding_cache_path: str | Path | None = DEFAULT_CACHE_PATH,
+    gzip_outputs: bool = False,
+    ingest_cache_dir: str | Path | None = None,
+    use_ingest_cache: bool = True,
 ) -> Dict[str, Any]:
+    # Stage modules pull in numpy, jsonschema and friends; importing them here
+    # keeps ``--help`` and argument errors fast.
+    from city_code_ingest import builder, chunker, embedder, ingest, mapper, schema_extractor, validator
+
     source_path = Path(input_path)
     output_root = Path(output_dir) if output_dir else OUTPUT_DIR
     intermediate_dir = output_root / "intermediate"
 
     output_root.mkdir(parents=True, exist_ok=True)
     intermediate_dir.mkdir(parents=True, exist_ok=True)
-
-    document = ingest.extract_document(str(source_path))
-    lines: List[str] = document["lines"]  # type: ignore[assignment]
-    layout: Dict[str, object] = document["layout"]  # type: ignore[assignment]
-
-    _write_lines(intermediate_dir / "raw_text.txt", lines)
-    _write_json(intermediate_dir / "layout.json", layout)
-
-    sections = chunker.split_sections(lines)
-    _write_json(intermediate_dir / "sections.json", sections)
-
-    catalog = schema_extractor.catalog_items(layout, use_llm=use_llm)
-    catalog_path = output_root / f"{source_path.stem}_catalog.json"
-    schema_extractor.save_catalog(catalog, catalog_path)
-
-    decision_points = mapper.link_items(catalog, layout)
-    _write_json(intermediate_dir / "decision_points.json", decision_points)
-
-    wizard_payload, guidance_payload = builder.build_outputs(
-        decision_points,
-        sections=sections,
-        catalog=catalog,
-        city=city,
-        state=state,
-        version=version,
-        source_url=source_url,
-    )
-
-    wizard_path = output_root / f"{source_path.stem}_wizard.json"
-    guidance_path = output_root / f"{source_path.stem}_guidance.json"
-    _write_json(wizard_path, wizard_payload)
-    _write_json(guidance_path, guidance_payload)
-
-    validation_report = validator.run_checks(wizard=wizard_payload, catalog=catalog)
-    validation_path = output_root / f"{source_path.stem}_validation.json"
-    validator.save_report(validation_report, validation_path)
-
-    pinecone_config = _resolve_pinecone_config(
-        api_key=pinecone_api_key,
-        index_name=pinecone_index_name,
-        environment=pinecone_environment,
-        namespace=pinecone_namespace,
-        host=pinecone_host,
-    )
-
-    city_slug = wizard_payload.get("jurisdiction", {}).get("city", city).replace(" ", "")
-    embeddings_filename = f"{city_slug}_{version}_embeddings.json"
-    embeddings_path = embedder.generate_embeddings(
-        wizard_path,
-        output_root / embeddings_filename,
-        pinecone_config=pinecone_config,
-        extra_metadata=wizard_payload.get("jurisdiction"),
-        use_llm=use_llm,
-        embed_level=embed_level,
-    )
+    large_suffix = ".json.gz" if gzip_outputs else ".json"
+    if use_ingest_cache:
+        ingest_cache = Path(ingest_cache_dir) if ingest_cache_dir else intermediate_dir / ".cache"
+    else:
+        ingest_cache = None
+
+    # Intermediate artifacts are never read back by later stages, so they are
+    # handed to writer threads while the next stage runs. Only the wizard file
+    # is written inline because the embedder loads it from disk.
+    with ThreadPoolExecutor(max_workers=_WRITER_THREADS) as writer:
+        pending = []
+
+        document = ingest.extract_document(str(source_path), cache_dir=ingest_cache)
+        lines: List[str] = document["lines"]  # type: ignore[assignment]
+        layout: Dict[str, object] = document["layout"]  # type: ignore[assignment]
+
+        pending.append(writer.submit(_write_lines, intermediate_dir / "raw_text.txt", lines))
+        pending.append(writer.submit(_write_json, intermediate_dir / "layout.json", layout))
+
+        sections = chunker.split_sections(lines)
+        pending.append(writer.submit(_write_json, intermediate_dir / "sections.json", sections))
+
+        catalog = schema_extractor.catalog_items(layout, use_llm=use_llm)
+        catalog_path = output_root / f"{source_path.stem}_catalog.json"
+        pending.append(writer.submit(schema_extractor.save_catalog, catalog, catalog_path))
+
+        decision_points = mapper.link_items(catalog, layout)
+        pending.append(writer.submit(_write_json, intermediate_dir / "decision_points.json", decision_points))
+
+        wizard_payload, guidance_payload = builder.build_outputs(
+            decision_points,
+            sections=sections,
+            catalog=catalog,
+            city=city,
+            state=state,
+            version=version,
+            source_url=source_url,
+        )
+
+        wizard_path = output_root / f"{source_path.stem}_wizard{large_suffix}"
+        guidance_path = output_root / f"{source_path.stem}_guidance{large_suffix}"
+        _write_json(wizard_path, wizard_payload)
+        pending.append(writer.submit(_write_json, guidance_path, guidance_payload))
+
+        validation_report = validator.run_checks(wizard=wizard_payload, catalog=catalog)
+        validation_path = output_root / f"{source_path.stem}_validation.json"
+        pending.append(writer.submit(validator.save_report, validation_report, validation_path))
+
+        pinecone_config = _resolve_pinecone_config(
+            api_key=pinecone_api_key,
+            index_name=pinecone_index_name,
+            environment=pinecone_environment,
+            namespace=pinecone_namespace,
+            host=pinecone_host,
+        )
+
+        city_slug = wizard_payload.get("jurisdiction", {}).get("city", city).replace(" ", "")
+        embeddings_filename = f"{city_slug}_{version}_embeddings{large_suffix}"
+        embeddings_path = embedder.generate_embeddings(
+            wizard_path,
+            output_root / embeddings_filename,
+            pinecone_config=pinecone_config,
+            extra_metadata=wizard_payload.get("jurisdiction"),
+            use_llm=use_llm,
+            embed_level=embed_level,
+            cache_path=embedding_cache_path,
+        )
+
+        for future in pending:
+            future.result()
 
     _log_summary(catalog, decision_points, validation_report)
 
@@ -113,24 +139,38 @@ def run_pipeline(
         "catalog_path": catalog_path,
         "validation_path": validation_path,
         "embeddings_path": embeddings_path,
+        "wizard": wizard_payload,
+        "guidance": guidance_payload,
         "catalog": catalog,
         "decision_points": decision_points,
         "pinecone_enabled": bool(pinecone_config),
     }
 
 
-def _write_lines(path: Path, lines: List[str]) -> None:
+def _write_lines(path: Path, lines: Iterable[str]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as handle:
-        handle.write("\n".join(lines))
-    print(f"[main] Wrote {len(lines)} lines to {path}")
+    count = 0
+    with path.open("w", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE) as handle:
+        for count, line in enumerate(lines, start=1):
+            handle.write(f"\n{line}" if count > 1 else line)
+    logger.info("[main] Wrote %d lines to %s", count, path)
 
 
 def _write_json(path: Path, payload: Any) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as handle:
-        json.dump(payload, handle, indent=2)
-    print(f"[main] Saved JSON to {path}")
+    if path.suffix == ".gz":
+        if orjson is not None:
+            data = orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        else:
+            data = json.dumps(payload, indent=2).encode("utf-8")
+        with gzip.open(path, "wb", compresslevel=_GZIP_LEVEL) as handle:
+            handle.write(data)
+    elif orjson is not None:
+        path.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with path.open("w", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE) as handle:
+            json.dump(payload, handle, indent=2)
+    logger.info("[main] Saved JSON to %s", path)
 
 
 def parse_args() -> argparse.Namespace:
@@ -153,11 +193,43 @@ def parse_args() -> argparse.Namespace:
         default="decision_point",
         help="Granularity for embeddings",
     )
+    parser.add_argument(
+        "--embedding-cache",
+        default=str(DEFAULT_CACHE_PATH),
+        dest="embedding_cache",
+        help="SQLite file caching LLM embeddings by text hash",
+    )
+    parser.add_argument(
+        "--no-embedding-cache",
+        action="store_const",
+        const=None,
+        dest="embedding_cache",
+        help="Always request fresh embeddings",
+    )
+    parser.add_argument(
+        "--ingest-cache-dir",
+        default=None,
+        help="Directory caching extracted text and layout (default: <output-dir>/intermediate/.cache)",
+    )
+    parser.add_argument(
+        "--no-ingest-cache",
+        action="store_false",
+        dest="use_ingest_cache",
+        help="Always re-extract the source document",
+    )
+    parser.add_argument(
+        "--gzip",
+        action="store_true",
+        dest="gzip_outputs",
+        help="Write wizard, guidance and embeddings as .json.gz",
+    )
     return parser.parse_args()
 
 
 def main() -> None:
+    load_dotenv()
     args = parse_args()
+    logging.basicConfig(level=os.getenv("CITY_CODE_LOG", "INFO").upper(), format="%(message)s")
     run_pipeline(
         args.input,
         city=args.city,
@@ -172,6 +244,10 @@ def main() -> None:
         pinecone_host=args.pinecone_host,
         use_llm=args.use_llm,
         embed_level=args.embed_level,
+        embedding_cache_path=args.embedding_cache,
+        gzip_outputs=args.gzip_outputs,
+        ingest_cache_dir=args.ingest_cache_dir,
+        use_ingest_cache=args.use_ingest_cache,
     )
 
 
@@ -213,11 +289,15 @@ def _log_summary(
     rad_count = len(catalog.get("RAD", []))
     po_count = len(catalog.get("PO", []))
     ead_count = len(catalog.get("EAD", []))
-    print(
-        f"[main] Summary: RAD={rad_count}, PO={po_count}, EAD={ead_count}, decision_points={len(decision_points)}"
+    logger.info(
+        "[main] Summary: RAD=%d, PO=%d, EAD=%d, decision_points=%d",
+        rad_count,
+        po_count,
+        ead_count,
+        len(decision_points),
     )
     issue_counts = {k: len(v) for k, v in validation_report.get("issues", {}).items()}
-    print(f"[main] Validation issues: {issue_counts}")
+    logger.info("[main] Validation issues: %s", issue_counts)
 
 
 if __name__ == "__main__":
@@ -3,8 +3,14 @@
 from __future__ import annotations
 
 from collections import defaultdict
+from dataclasses import dataclass
 import re
-from typing import Dict, Iterable, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+try:  # pragma: no cover - optional dependency
+    import numpy as np
+except ImportError:  # pragma: no cover - fall back to per-item set arithmetic
+    np = None  # type: ignore
 
 try:  # pragma: no cover - optional dependency
     from tqdm import tqdm
@@ -13,6 +19,11 @@ except ImportError:  # pragma: no cover - fallback when tqdm missing
         return iterable
 
 
+TOKEN_PATTERN = re.compile(r"[A-Za-z0-9]+")
+PO_SEPARATOR_PATTERN = re.compile(r",\s*")
+DIGITS_PATTERN = re.compile(r"\d+")
+
+
 def link_items(
     catalog: Dict[str, List[Dict[str, object]]],
     layout: Dict[str, object],
@@ -28,31 +39,36 @@ def link_items(
     if rad_po_table is None:
         rad_po_table = _parse_correspondence_table(layout)
 
+    po_by_page = _group_by_page(po_items)
+    po_index = _TokenIndex.build(po_items)
+    ead_index = _TokenIndex.build(ead_items)
+
     decision_points: list[dict[str, object]] = []
 
     for rad_id, rad_item in tqdm(rad_items.items(), desc="Mapping RAD -> PO/EAD"):
         rad_text = rad_item.get("text", "")
         page = rad_item.get("page")
+        rad_tokens = set(_tokenize(rad_text)) if rad_text else set()
 
         linked_po_ids = list(rad_po_table.get(rad_id, []))
         if not linked_po_ids:
-            linked_po_ids = _find_nearby_po(rad_item, po_items)
+            linked_po_ids = _find_nearby_po(rad_item, po_by_page)
 
         if not linked_po_ids:
-            linked_po_ids = _similar_po(rad_text, po_items)
+            linked_po_ids = _similar_po(rad_tokens, po_index)
 
         po_details = [
             {
                 "po_id": po_id,
-                "text": po_items[po_id]["text"],
-                "page": po_items[po_id]["page"],
-                "span": po_items[po_id]["span"],
+                "text": po_item["text"],
+                "page": po_item["page"],
+                "span": po_item["span"],
             }
             for po_id in linked_po_ids
-            if po_id in po_items
+            if (po_item := po_items.get(po_id)) is not None
         ]
 
-        ead_links, ead_details = _find_related_ead(rad_item, ead_items)
+        ead_links, ead_details = _find_related_ead(rad_item, rad_tokens, ead_items, ead_index)
 
         decision_points.append(
             {
@@ -79,7 +95,8 @@ def link_items(
 
 def _parse_correspondence_table(layout: Dict[str, object]) -> Dict[str, List[str]]:
     pages = layout.get("pages", [])
-    mapping: dict[str, list[str]] = defaultdict(list)
+    mapping: dict[str, list[str]] = {}
+    seen: dict[str, set[str]] = defaultdict(set)
     last_po: Optional[List[str]] = None
     in_table = False
     blank_rows = 0
@@ -114,16 +131,21 @@ def _parse_correspondence_table(layout: Dict[str, object]) -> Dict[str, List[str
 
             if lowered.startswith("rad") and last_po is not None:
                 rad_id = text.split()[0].replace(" ", "").upper()
-                mapping[rad_id].extend([po for po in last_po if po])
+                linked = mapping.setdefault(rad_id, [])
+                linked_seen = seen[rad_id]
+                for po in last_po:
+                    if po and po not in linked_seen:
+                        linked_seen.add(po)
+                        linked.append(po)
                 continue
 
-    return {rad: list(dict.fromkeys(pos)) for rad, pos in mapping.items()}
+    return mapping
 
 
 def _expand_po_tokens(token_str: str) -> List[str]:
     token_str = token_str.replace("–", "-")
     tokens: list[str] = []
-    for part in re.split(r",\s*", token_str):
+    for part in PO_SEPARATOR_PATTERN.split(token_str):
         part = part.strip()
         if not part:
             continue
@@ -143,76 +165,145 @@ def _expand_po_tokens(token_str: str) -> List[str]:
 
 
 def _extract_digits(value: str) -> Optional[int]:
-    match = re.search(r"\d+", value)
+    match = DIGITS_PATTERN.search(value)
     if not match:
         return None
     return int(match.group())
 
 
-def _find_nearby_po(rad_item: Dict[str, object], po_items: Dict[str, Dict[str, object]]) -> List[str]:
+def _group_by_page(items: Dict[str, Dict[str, object]]) -> Dict[int, List[str]]:
+    by_page: dict[int, list[str]] = defaultdict(list)
+    for item_id, item in items.items():
+        by_page[item.get("page", 0)].append(item_id)
+    return by_page
+
+
+def _find_nearby_po(rad_item: Dict[str, object], po_by_page: Dict[int, List[str]]) -> List[str]:
     page = rad_item.get("page", 0)
     candidates = [
         po_id
-        for po_id, po_item in po_items.items()
-        if abs(po_item.get("page", 0) - page) <= 1
+        for nearby_page in (page - 1, page, page + 1)
+        for po_id in po_by_page.get(nearby_page, ())
     ]
     return sorted(candidates)
 
 
-def _similar_po(rad_text: str, po_items: Dict[str, Dict[str, object]]) -> List[str]:
-    if not rad_text:
-        return []
-
-    rad_tokens = set(_tokenize(rad_text))
+def _similar_po(rad_tokens: Set[str], po_index: "_TokenIndex") -> List[str]:
     if not rad_tokens:
         return []
 
-    scored: list[tuple[str, float]] = []
-    for po_id, po_item in po_items.items():
-        po_tokens = set(_tokenize(po_item.get("text", "")))
-        if not po_tokens:
-            continue
-        overlap = len(rad_tokens & po_tokens) / max(len(rad_tokens | po_tokens), 1)
-        if overlap > 0.1:
-            scored.append((po_id, overlap))
-
-    scored.sort(key=lambda pair: pair[1], reverse=True)
-    return [po_id for po_id, _ in scored[:3]]
+    return po_index.top_matches(rad_tokens, threshold=0.1, limit=3)
 
 
-def _find_related_ead(rad_item: Dict[str, object], ead_items: Dict[str, Dict[str, object]]) -> tuple[List[str], List[Dict[str, object]]]:
+def _find_related_ead(
+    rad_item: Dict[str, object],
+    rad_tokens: Set[str],
+    ead_items: Dict[str, Dict[str, object]],
+    ead_index: "_TokenIndex",
+) -> tuple[List[str], List[Dict[str, object]]]:
     if not ead_items:
         return [], []
 
     page = rad_item.get("page", 0)
-    rad_tokens = set(_tokenize(rad_item.get("text", "")))
 
     ead_links: list[str] = []
     ead_detail: list[dict[str, object]] = []
-    for ead_id, ead_item in ead_items.items():
-        if abs(ead_item.get("page", 0) - page) > 1:
-            continue
-
-        score = 0.0
-        if rad_tokens:
-            ead_tokens = set(_tokenize(ead_item.get("text", "")))
-            if ead_tokens:
-                score = len(rad_tokens & ead_tokens) / max(len(rad_tokens | ead_tokens), 1)
-
-        if score >= 0.05:
-            ead_links.append(ead_id)
-            ead_detail.append(
-                {
-                    "ead_id": ead_id,
-                    "text": ead_item.get("text", ""),
-                    "page": ead_item.get("page"),
-                    "span": ead_item.get("span"),
-                }
-            )
+    for ead_id in ead_index.matches_near(rad_tokens, page, threshold=0.05):
+        ead_item = ead_items[ead_id]
+        ead_links.append(ead_id)
+        ead_detail.append(
+            {
+                "ead_id": ead_id,
+                "text": ead_item.get("text", ""),
+                "page": ead_item.get("page"),
+                "span": ead_item.get("span"),
+            }
+        )
 
     return ead_links, ead_detail
 
 
+@dataclass
+class _TokenIndex:
+    """Token sets for a fixed group of catalog items, scored against a query by Jaccard overlap.
+
+    With numpy, the sets are held as an inverted index (token -> item positions),
+    so one query costs a bincount over its postings instead of a set operation per item.
+    """
+
+    ids: List[str]
+    pages: Any
+    token_sets: List[Set[str]]
+    postings: Dict[str, Any]
+    sizes: Any
+
+    @classmethod
+    def build(cls, items: Dict[str, Dict[str, object]]) -> "_TokenIndex":
+        ids = list(items)
+        pages = [items[item_id].get("page", 0) for item_id in ids]
+        token_sets = [set(_tokenize(items[item_id].get("text", ""))) for item_id in ids]
+        sizes: Any = [len(tokens) for tokens in token_sets]
+        postings: dict[str, Any] = {}
+        if np is not None:
+            grouped: dict[str, list[int]] = defaultdict(list)
+            for position, tokens in enumerate(token_sets):
+                for token in tokens:
+                    grouped[token].append(position)
+            postings = {token: np.array(positions, dtype=np.intp) for token, positions in grouped.items()}
+            sizes = np.array(sizes, dtype=np.int64)
+            pages = np.asarray(pages)
+        return cls(ids=ids, pages=pages, token_sets=token_sets, postings=postings, sizes=sizes)
+
+    def scores(self, tokens: Set[str]) -> Any:
+        """Jaccard overlap of ``tokens`` with every item, in item order."""
+
+        if np is None:
+            query_size = len(tokens)
+            scores: list[float] = []
+            for item_tokens, size in zip(self.token_sets, self.sizes):
+                intersection = len(tokens & item_tokens)
+                scores.append(intersection / max(query_size + size - intersection, 1))
+            return scores
+
+        hits = [self.postings[token] for token in tokens if token in self.postings]
+        if hits:
+            intersection = np.bincount(np.concatenate(hits), minlength=len(self.ids))
+        else:
+            intersection = np.zeros(len(self.ids), dtype=np.int64)
+        union = len(tokens) + self.sizes - intersection
+        return intersection / np.maximum(union, 1)
+
+    def top_matches(self, tokens: Set[str], *, threshold: float, limit: int) -> List[str]:
+        """Ids scoring above ``threshold``, best first; ties keep item order."""
+
+        scores = self.scores(tokens)
+        if np is None:
+            scored = [(position, score) for position, score in enumerate(scores) if score > threshold]
+            scored.sort(key=lambda pair: pair[1], reverse=True)
+            return [self.ids[position] for position, _ in scored[:limit]]
+
+        candidates = np.flatnonzero(scores > threshold)
+        ranked = candidates[np.argsort(-scores[candidates], kind="stable")]
+        return [self.ids[position] for position in ranked[:limit]]
+
+    def matches_near(self, tokens: Set[str], page: int, *, threshold: float) -> List[str]:
+        """Ids on ``page`` +/- 1 scoring at least ``threshold``, in item order."""
+
+        if not self.ids or not tokens:
+            return []
+
+        scores = self.scores(tokens)
+        if np is None:
+            return [
+                self.ids[position]
+                for position, score in enumerate(scores)
+                if score >= threshold and abs(self.pages[position] - page) <= 1
+            ]
+
+        mask = (scores >= threshold) & (np.abs(self.pages - page) <= 1)
+        return [self.ids[position] for position in np.flatnonzero(mask)]
+
+
 def _format_question(rad_id: str, rad_text: str) -> str:
     rad_summary = rad_text.splitlines()[0].strip() if rad_text else ""
     if rad_summary:
@@ -222,12 +313,12 @@ def _format_question(rad_id: str, rad_text: str) -> str:
 
 
 def _tokenize(text: str) -> List[str]:
-    return [token.lower() for token in re.findall(r"[A-Za-z0-9]+", text)]
+    return [token.lower() for token in TOKEN_PATTERN.findall(text)]
 
 
 def _decision_point_sort_key(dp: Dict[str, object]) -> tuple[int, str]:
     rad_id = str(dp.get("rad_id", ""))
-    match = re.search(r"\d+", rad_id)
+    match = DIGITS_PATTERN.search(rad_id)
     numeric = int(match.group()) if match else 0
     return (numeric, rad_id)
 
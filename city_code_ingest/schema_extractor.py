@@ -11,6 +11,11 @@ from typing import Dict, Iterable, List, Optional
 
 from dotenv import load_dotenv
 
+try:  # pragma: no cover - optional dependency
+    import orjson
+except ImportError:  # pragma: no cover - fall back to stdlib json
+    orjson = None  # type: ignore
+
 try:  # pragma: no cover - optional dependency
     from tqdm import tqdm
 except ImportError:  # pragma: no cover - fallback when tqdm missing
@@ -21,7 +26,10 @@ except ImportError:  # pragma: no cover - fallback when tqdm missing
 load_dotenv()
 
 
-CATALOG_ITEM_RE = re.compile(r"\b((?:RAD|PO|EAD)\s*\d+[\.\d]*)\b", re.IGNORECASE)
+# json.dump emits many small chunks; a larger buffer batches them into fewer writes.
+_WRITE_BUFFER_SIZE = 64 * 1024
+
+CATALOG_ITEM_RE = re.compile(r"\b((?P<type>RAD|PO|EAD)\s*\d+[\.\d]*)\b", re.IGNORECASE)
 
 
 @dataclass
@@ -35,7 +43,7 @@ class CatalogItem:
     def to_dict(self) -> Dict[str, object]:
         return {
             "id": self.id,
-            "text": self.text.strip(),
+            "text": self.text,
             "page": self.page,
             "span": self.span,
             "type": self.type,
@@ -64,7 +72,10 @@ def catalog_items(layout: Dict[str, object], *, use_llm: bool = False) -> Dict[s
 
 def save_catalog(catalog: Dict[str, List[Dict[str, object]]], path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as handle:
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(catalog, option=orjson.OPT_INDENT_2))
+        return
+    with path.open("w", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE) as handle:
         json.dump(catalog, handle, indent=2)
 
 
@@ -108,7 +119,7 @@ def extract_via_llm(pages: List[Dict[str, object]]) -> List[Dict[str, object]]:
             items.append(
                 CatalogItem(
                     id=identifier,
-                    text=entry.get("text", ""),
+                    text=entry.get("text", "").strip(),
                     page=int(entry.get("page", 1)),
                     span=[int(entry.get("span_start", 0)), int(entry.get("span_end", 0))],
                     type=item_type,
@@ -142,16 +153,14 @@ def _extract_via_regex(pages: List[Dict[str, object]]) -> List[Dict[str, object]
 
             for match in matches:
                 identifier = match.group(1).replace(" ", "").upper()
-                item_type = "RAD" if identifier.startswith("RAD") else "PO" if identifier.startswith("PO") else "EAD"
+                item_type = match["type"].upper()
                 span_start = char_cursor + match.start()
                 span_end = char_cursor + match.end()
 
-                # Attempt to gather context lines around the identifier
-                context = text
                 items.append(
                     CatalogItem(
                         id=identifier,
-                        text=context,
+                        text=text,
                         page=page_num,
                         span=[span_start, span_end],
                         type=item_type,
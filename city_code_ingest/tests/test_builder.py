@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+import city_code_ingest.builder as builder
+from city_code_ingest.builder import _build_breadcrumbs
+
+
+def test_build_breadcrumbs_without_breadcrumb_key() -> None:
+    section_meta = {
+        "title_number": 1,
+        "title_name": "General",
+        "chapter_number": 2,
+        "chapter_name": None,
+        "heading": "Section 1.2.3 Scope",
+    }
+
+    assert _build_breadcrumbs(section_meta) == ["Title 1: General", "Chapter 2", "Section 1.2.3 Scope"]
+
+
+def test_build_breadcrumbs_falls_back_to_breadcrumb() -> None:
+    assert _build_breadcrumbs({"breadcrumb": "Part A > Section 1"}) == ["Part A > Section 1"]
+    assert _build_breadcrumbs({}) == []
+
+
+@pytest.mark.parametrize("backend", ["jsonschema_rs", "jsonschema"])
+@pytest.mark.parametrize(
+    "content",
+    [None, "{not json", '{"type": 12}'],
+    ids=["missing", "corrupt", "invalid-schema"],
+)
+def test_unloadable_schema_skips_validation(monkeypatch, tmp_path: Path, backend: str, content) -> None:
+    if backend == "jsonschema_rs" and builder.jsonschema_rs is None:
+        pytest.skip("jsonschema_rs is not installed")
+    if backend == "jsonschema":
+        if builder.Draft7Validator is None:
+            pytest.skip("jsonschema is not installed")
+        monkeypatch.setattr(builder, "jsonschema_rs", None)
+
+    schema_path = tmp_path / "wizard_schema.json"
+    if content is not None:
+        schema_path.write_text(content, encoding="utf-8")
+
+    assert builder._load_validator(schema_path) is None
+
+
+def test_decision_points_without_sections_raise() -> None:
+    with pytest.raises(ValueError):
+        builder._assign_decision_points_to_sections([{"rad_id": "RAD1"}], [])
@@ -1,15 +1,19 @@
 from __future__ import annotations
 
+import gzip
 import json
 import sys
 from pathlib import Path
 from typing import Any, Dict, List
 
+import pytest
+
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
 import city_code_ingest.embedder as embedder
+from city_code_ingest.embedding_cache import EmbeddingCache
 
 
 def test_generate_embeddings_decision_point(monkeypatch, tmp_path: Path) -> None:
@@ -91,3 +95,192 @@ def test_generate_embeddings_decision_point(monkeypatch, tmp_path: Path) -> None
 
     total_upserts = sum(len(batch) for batch in batches)
     assert total_upserts == len(data)
+
+
+def test_embedding_cache_round_trip(tmp_path: Path) -> None:
+    cache = EmbeddingCache(tmp_path / "cache.sqlite")
+    key = EmbeddingCache.key(embedder.EMBEDDING_MODEL, "PO1: body")
+    try:
+        assert cache.get(key) is None
+        cache.put(key, [0.25, -1.0, 0.5], model=embedder.EMBEDDING_MODEL)
+        assert cache.get(key) == [0.25, -1.0, 0.5]
+        assert cache.get_many([key, EmbeddingCache.key(embedder.EMBEDDING_MODEL, "other")]) == {
+            key: [0.25, -1.0, 0.5]
+        }
+    finally:
+        cache.close()
+
+
+def test_embedding_cache_unusable_path_is_skipped(tmp_path: Path) -> None:
+    blocker = tmp_path / "not-a-dir"
+    blocker.write_text("", encoding="utf-8")
+    cache = EmbeddingCache(blocker / "cache.sqlite")
+    key = EmbeddingCache.key(embedder.EMBEDDING_MODEL, "PO1: body")
+
+    assert cache.get(key) is None
+    cache.put(key, [0.25, -1.0, 0.5], model=embedder.EMBEDDING_MODEL)
+    assert cache.get_many([key]) == {}
+    cache.close()
+
+
+def test_generate_embeddings_binary_sidecar(tmp_path: Path) -> None:
+    wizard_payload = {
+        "jurisdiction": {"city": "Test City", "version": "2025-01"},
+        "titles": [
+            {
+                "title_name": "Title 1",
+                "chapters": [
+                    {
+                        "chapter_name": "Chapter 1",
+                        "sections": [
+                            {"section_id": "1.1.1", "section_title": "Section 1", "text": "Body one"},
+                            {"section_id": "1.1.2", "section_title": "Section 2", "text": "Body two"},
+                        ],
+                    }
+                ],
+            }
+        ],
+    }
+    wizard_path = tmp_path / "wizard.json"
+    wizard_path.write_text(json.dumps(wizard_payload), encoding="utf-8")
+
+    result_path = embedder.generate_embeddings(
+        wizard_path,
+        output_path=tmp_path / "embeddings.json",
+        embed_level="section",
+        binary=True,
+    )
+
+    with result_path.open("r", encoding="utf-8") as handle:
+        meta = json.load(handle)
+    ids, vectors = embedder.load_embeddings(result_path)
+
+    assert result_path.name == "embeddings.meta.json"
+    assert [item["id"] for item in meta] == ids
+    assert all("embedding" not in item for item in meta)
+    assert vectors.shape == (2, embedder.EMBEDDING_DIM)
+    assert str(vectors.dtype) == "float16"
+
+
+def test_generate_embeddings_gzip_round_trip(tmp_path: Path) -> None:
+    wizard_payload = {
+        "jurisdiction": {"city": "Test City", "version": "2025-01"},
+        "titles": [
+            {
+                "title_name": "Title 1",
+                "chapters": [
+                    {
+                        "chapter_name": "Chapter 1",
+                        "sections": [{"section_id": "1.1.1", "section_title": "Section 1", "text": "Body one"}],
+                    }
+                ],
+            }
+        ],
+    }
+    wizard_path = tmp_path / "wizard.json.gz"
+    with gzip.open(wizard_path, "wt", encoding="utf-8") as handle:
+        json.dump(wizard_payload, handle)
+
+    result_path = embedder.generate_embeddings(
+        wizard_path,
+        output_path=tmp_path / "embeddings.json.gz",
+        embed_level="section",
+    )
+
+    with gzip.open(result_path, "rt", encoding="utf-8") as handle:
+        data = json.load(handle)
+
+    assert [item["metadata"]["section_id"] for item in data] == ["1.1.1"]
+    assert len(data[0]["embedding"]) == embedder.EMBEDDING_DIM
+
+
+def test_writer_failure_is_not_reported_as_pinecone_failure(monkeypatch, tmp_path: Path) -> None:
+    from city_code_ingest.vector_store import PineconeVectorStore
+
+    wizard_payload = {
+        "jurisdiction": {"city": "Test City", "version": "2025-01"},
+        "titles": [
+            {
+                "title_name": "Title 1",
+                "chapters": [
+                    {
+                        "chapter_name": "Chapter 1",
+                        "sections": [
+                            {"section_id": "1.1.1", "section_title": "Section 1", "text": "Body one"},
+                            {"section_id": "1.1.2", "section_title": "Section 2", "text": "Body two"},
+                        ],
+                    }
+                ],
+            }
+        ],
+    }
+    wizard_path = tmp_path / "wizard.json"
+    wizard_path.write_text(json.dumps(wizard_payload), encoding="utf-8")
+
+    def fake_upsert(self, vectors, *, namespace=None):
+        return sum(1 for _ in vectors)
+
+    def failing_dumps(record):
+        raise OSError("No space left on device")
+
+    monkeypatch.setattr(PineconeVectorStore, "upsert_embeddings", fake_upsert)
+    monkeypatch.setattr(embedder, "_dumps", failing_dumps)
+
+    with pytest.raises(OSError, match="No space left"):
+        embedder.generate_embeddings(
+            wizard_path,
+            output_path=tmp_path / "embeddings.json",
+            pinecone_config={"api_key": "key", "index_name": "idx"},
+            embed_level="section",
+        )
+
+
+def test_pinecone_failure_still_writes_every_record(monkeypatch, tmp_path: Path) -> None:
+    from city_code_ingest.vector_store import PineconeVectorStore
+
+    wizard_payload = {
+        "jurisdiction": {"city": "Test City", "version": "2025-01"},
+        "titles": [
+            {
+                "title_name": "Title 1",
+                "chapters": [
+                    {
+                        "chapter_name": "Chapter 1",
+                        "sections": [
+                            {"section_id": f"1.1.{idx}", "section_title": f"Section {idx}", "text": f"Body {idx}"}
+                            for idx in range(1, 6)
+                        ],
+                    }
+                ],
+            }
+        ],
+    }
+    wizard_path = tmp_path / "wizard.json"
+    wizard_path.write_text(json.dumps(wizard_payload), encoding="utf-8")
+
+    def failing_upsert(self, vectors, *, namespace=None):
+        next(iter(vectors))
+        raise ConnectionError("Pinecone unavailable")
+
+    monkeypatch.setattr(PineconeVectorStore, "upsert_embeddings", failing_upsert)
+
+    result_path = embedder.generate_embeddings(
+        wizard_path,
+        output_path=tmp_path / "embeddings.json",
+        pinecone_config={"api_key": "key", "index_name": "idx"},
+        embed_level="section",
+    )
+
+    with result_path.open("r", encoding="utf-8") as handle:
+        data = json.load(handle)
+    assert [item["metadata"]["section_id"] for item in data] == [f"1.1.{idx}" for idx in range(1, 6)]
+
+
+def test_fallback_vector_matches_without_numpy(monkeypatch) -> None:
+    if embedder.np is None:
+        pytest.skip("numpy is not installed")
+    seeds = ["1.1.1:RAD1", "RAD2_PO1", "section"]
+    with_numpy = [embedder._fallback_vector(seed) for seed in seeds]
+    monkeypatch.setattr(embedder, "np", None)
+    assert [embedder._fallback_vector(seed) for seed in seeds] == with_numpy
+    assert all(len(vector) == embedder.EMBEDDING_DIM for vector in with_numpy)
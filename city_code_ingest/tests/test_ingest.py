@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+import city_code_ingest.ingest as ingest
+
+
+SAMPLE_PATH = PROJECT_ROOT / "data" / "mbrc-planning-scheme-part-9.3.1.pdf"
+
+
+def _fail(*_: object) -> None:
+    raise RuntimeError("simulated extractor failure")
+
+
+def test_fallback_text_is_not_cached(monkeypatch, tmp_path: Path) -> None:
+    cache_dir = tmp_path / "cache"
+
+    monkeypatch.setattr(ingest, "_extract_pdf_page_range", _fail)
+    fallback = ingest.extract_text(str(SAMPLE_PATH), num_workers=1, cache_dir=cache_dir)
+    assert fallback[0].startswith("%PDF"), "PyMuPDF failure should use the binary fallback"
+    assert not list(cache_dir.glob("*.json")), "fallback output must not be cached"
+
+    monkeypatch.undo()
+    lines = ingest.extract_text(str(SAMPLE_PATH), num_workers=1, cache_dir=cache_dir)
+    assert not lines[0].startswith("%PDF")
+    assert len(list(cache_dir.glob("*.lines.json"))) == 1
+
+    monkeypatch.setattr(ingest, "_extract_text", _fail)
+    assert ingest.extract_text(str(SAMPLE_PATH), num_workers=1, cache_dir=cache_dir) == lines
+
+
+def test_fallback_layout_is_not_cached(monkeypatch, tmp_path: Path) -> None:
+    cache_dir = tmp_path / "cache"
+
+    monkeypatch.setattr(ingest, "_extract_pdf_layout_page_range", _fail)
+    layout = ingest.extract_layout(str(SAMPLE_PATH), num_workers=1, cache_dir=cache_dir)
+    assert layout["pages"], "PyMuPDF should stand in for pdfplumber"
+    assert not list(cache_dir.glob("*.layout.json")), "fallback layout must not be cached"
+
+
+_PLAIN_HTML = (
+    "<html><body>\n<h1>Part 9 Codes</h1>\n<p>RAD1 Café &amp; setbacks</p>\n</body></html>\n"
+)
+_XHTML = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n'
+    '<html xmlns="http://www.w3.org/1999/xhtml"><body>\n'
+    "<h1>Part 9 Codes</h1>\n<p>RAD1 Café &amp; setbacks</p>\n</body></html>\n"
+)
+
+
+@pytest.mark.parametrize("backend", ["lexbor", "lxml", "html.parser"])
+@pytest.mark.parametrize("document", [_PLAIN_HTML, _XHTML], ids=["html", "xhtml"])
+def test_html_backends(monkeypatch, tmp_path: Path, backend: str, document: str) -> None:
+    if backend == "lexbor" and ingest.LexborHTMLParser is None:
+        pytest.skip("selectolax is not installed")
+    if backend == "lxml" and ingest.lxml_html is None:
+        pytest.skip("lxml is not installed")
+    if backend != "lexbor":
+        monkeypatch.setattr(ingest, "LexborHTMLParser", None)
+    if backend == "html.parser":
+        monkeypatch.setattr(ingest, "lxml_html", None)
+
+    path = tmp_path / "code.html"
+    path.write_text(document, encoding="utf-8")
+
+    lines = ingest.extract_text(str(path), cache_dir=None)
+    assert lines[-2:] == ["Part 9 Codes", "RAD1 Café & setbacks"]
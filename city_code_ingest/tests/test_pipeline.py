@@ -3,6 +3,14 @@ from __future__ import annotations
 import json
 import sys
 from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+
+try:  # pragma: no cover - optional dependency
+    import ijson
+except ImportError:  # pragma: no cover - fall back to json.load
+    ijson = None  # type: ignore
 
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 if str(PROJECT_ROOT) not in sys.path:
@@ -14,33 +22,30 @@ from city_code_ingest.main import run_pipeline
 SAMPLE_PATH = Path(__file__).resolve().parents[2] / "data" / "mbrc-planning-scheme-part-9.3.1.pdf"
 
 
-def test_pipeline_smoke(tmp_path: Path) -> None:
-    output_dir = tmp_path / "output"
-    result = run_pipeline(
+@pytest.fixture(scope="session")
+def pipeline_result(tmp_path_factory: pytest.TempPathFactory) -> Dict[str, Any]:
+    return run_pipeline(
         SAMPLE_PATH,
         city="Moreton Bay",
         state="QLD",
         version="2025-01",
         source_url="https://example.org/code",
-        output_dir=output_dir,
+        output_dir=tmp_path_factory.mktemp("output"),
     )
 
-    wizard_path = Path(result["wizard_path"])
-    guidance_path = Path(result["guidance_path"])
-    catalog_path = Path(result["catalog_path"])
-    validation_path = Path(result["validation_path"])
-    embeddings_path = Path(result["embeddings_path"])
-    assert isinstance(result["pinecone_enabled"], bool)
 
-    assert wizard_path.exists(), "wizard json should be generated"
-    assert guidance_path.exists(), "guidance json should be generated"
-    assert catalog_path.exists(), "catalog json should be generated"
-    assert validation_path.exists(), "validation json should be generated"
-    assert embeddings_path.exists(), "embeddings.json should be generated"
+def test_pipeline_writes_outputs(pipeline_result: Dict[str, Any]) -> None:
+    assert isinstance(pipeline_result["pinecone_enabled"], bool)
+
+    assert Path(pipeline_result["wizard_path"]).exists(), "wizard json should be generated"
+    assert Path(pipeline_result["guidance_path"]).exists(), "guidance json should be generated"
+    assert Path(pipeline_result["catalog_path"]).exists(), "catalog json should be generated"
+    assert Path(pipeline_result["validation_path"]).exists(), "validation json should be generated"
+    assert Path(pipeline_result["embeddings_path"]).exists(), "embeddings.json should be generated"
 
-    with wizard_path.open("r", encoding="utf-8") as handle:
-        payload = json.load(handle)
 
+def test_wizard_shape(pipeline_result: Dict[str, Any]) -> None:
+    payload = pipeline_result["wizard"]
     assert payload["jurisdiction"]["city"] == "Moreton Bay"
     assert payload["titles"], "titles should not be empty"
     first_title = payload["titles"][0]
@@ -55,9 +60,9 @@ def test_pipeline_smoke(tmp_path: Path) -> None:
         assert dp["source_refs"], "decision point should include source refs"
         assert dp["po_links"] or dp.get("no_po_applicable")
 
-    with guidance_path.open("r", encoding="utf-8") as handle:
-        guidance_payload = json.load(handle)
 
+def test_guidance_entries(pipeline_result: Dict[str, Any]) -> None:
+    guidance_payload = pipeline_result["guidance"]
     assert guidance_payload["guidance"], "guidance entries should exist"
     first_guidance = guidance_payload["guidance"][0]
     assert first_guidance.get("entry_type") == "section"
@@ -68,23 +73,30 @@ def test_pipeline_smoke(tmp_path: Path) -> None:
     for dg in decision_guidances:
         assert "po_details" in dg
 
-    with catalog_path.open("r", encoding="utf-8") as handle:
+
+def test_catalog_and_validation(pipeline_result: Dict[str, Any]) -> None:
+    with Path(pipeline_result["catalog_path"]).open("r", encoding="utf-8") as handle:
         catalog_payload = json.load(handle)
 
     rad_count = len(catalog_payload.get("RAD", []))
-    assert rad_count == len(result["decision_points"])
+    assert rad_count == len(pipeline_result["decision_points"])
 
-    with validation_path.open("r", encoding="utf-8") as handle:
+    with Path(pipeline_result["validation_path"]).open("r", encoding="utf-8") as handle:
         validation_payload = json.load(handle)
 
     assert validation_payload["status"] == "ok"
     assert not any(validation_payload["issues"].values())
 
-    with embeddings_path.open("r", encoding="utf-8") as handle:
-        embeddings_payload = json.load(handle)
 
-    assert embeddings_payload, "embeddings should not be empty"
-    assert len(embeddings_payload) == len(result["decision_points"])
-    vector = embeddings_payload[0]["embedding"]
+def test_embeddings(pipeline_result: Dict[str, Any]) -> None:
+    with Path(pipeline_result["embeddings_path"]).open("rb") as handle:
+        # Stream records so only one vector is held at a time.
+        records = ijson.items(handle, "item", use_float=True) if ijson is not None else iter(json.load(handle))
+        first_record = next(records, None)
+        record_count = sum(1 for _ in records) + (first_record is not None)
+
+    assert first_record is not None, "embeddings should not be empty"
+    assert record_count == len(pipeline_result["decision_points"])
+    vector = first_record["embedding"]
     assert len(vector) == 1536
-    assert embeddings_payload[0]["metadata"].get("rad_id")
+    assert first_record["metadata"].get("rad_id")
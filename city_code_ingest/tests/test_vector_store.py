@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, List
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from city_code_ingest.vector_store import PineconeVectorStore
+
+
+class _RecordingIndex:
+    def __init__(self) -> None:
+        self.batches: List[List[dict]] = []
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def upsert(self, *, vectors: List[dict], namespace: Any = None) -> None:
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.02)
+        with self._lock:
+            self.active -= 1
+            self.batches.append(vectors)
+
+
+def test_upsert_embeddings_async_batches_within_pool_threads() -> None:
+    index = _RecordingIndex()
+    store = PineconeVectorStore(api_key="key", index_name="idx", batch_size=2, pool_threads=3)
+    store._index = index
+    vectors = [{"id": str(idx), "values": [float(idx)]} for idx in range(11)]
+
+    total = asyncio.run(store.upsert_embeddings_async(iter(vectors), namespace="ns"))
+
+    assert total == 11
+    assert sorted(len(batch) for batch in index.batches) == [1, 2, 2, 2, 2, 2]
+    assert sorted(item["id"] for batch in index.batches for item in batch) == sorted(v["id"] for v in vectors)
+    assert 1 < index.peak <= 3
+
+
+def test_upsert_embeddings_async_propagates_batch_errors() -> None:
+    class _FailingIndex:
+        def upsert(self, *, vectors: List[dict], namespace: Any = None) -> None:
+            raise ConnectionError("Pinecone unavailable")
+
+    store = PineconeVectorStore(api_key="key", index_name="idx", batch_size=2, pool_threads=2)
+    store._index = _FailingIndex()
+
+    with pytest.raises(ConnectionError):
+        asyncio.run(store.upsert_embeddings_async([{"id": "1", "values": [1.0]}] * 5))
@@ -4,7 +4,12 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from typing import Dict, List, Set
+from typing import Dict, List, Set, Tuple
+
+try:  # pragma: no cover - optional dependency
+    import orjson
+except ImportError:  # pragma: no cover - fall back to stdlib json
+    orjson = None  # type: ignore
 
 
 def run_checks(
@@ -12,39 +17,39 @@ def run_checks(
     wizard: Dict[str, object],
     catalog: Dict[str, List[Dict[str, object]]],
 ) -> Dict[str, object]:
-    rad_ids = {item["id"] for item in catalog.get("RAD", [])}
-    po_ids = {item["id"] for item in catalog.get("PO", [])}
-    ead_ids = {item["id"] for item in catalog.get("EAD", [])}
-
-    duplicate_ids = _find_duplicates(catalog)
-    span_conflicts = _find_missing_spans(catalog)
+    ids_by_type, duplicate_ids, span_conflicts = _scan_catalog(catalog)
+    rad_ids = ids_by_type.get("RAD", set())
+    po_ids = ids_by_type.get("PO", set())
+    ead_ids = ids_by_type.get("EAD", set())
 
-    missing_links: list[str] = []
-    dangling_refs: list[str] = []
+    missing_links: set[str] = set()
+    dangling_refs: set[str] = set()
+    decision_point_count = 0
 
     for decision_point in _iter_decision_points(wizard):
+        decision_point_count += 1
         rad_id = decision_point.get("rad_id")
         po_links = decision_point.get("po_links", [])
         no_po = decision_point.get("no_po_applicable", False)
 
         if not po_links and not no_po:
-            missing_links.append(str(rad_id))
+            missing_links.add(str(rad_id))
 
         for po_id in po_links:
             if po_id not in po_ids:
-                dangling_refs.append(f"{rad_id}->{po_id}")
+                dangling_refs.add(f"{rad_id}->{po_id}")
 
         for ead in decision_point.get("ead_links", []):
             if ead not in ead_ids:
-                dangling_refs.append(f"{rad_id}->{ead}")
+                dangling_refs.add(f"{rad_id}->{ead}")
 
         if rad_id not in rad_ids:
-            dangling_refs.append(f"wizard_rad_missing:{rad_id}")
+            dangling_refs.add(f"wizard_rad_missing:{rad_id}")
 
     report = {
         "issues": {
-            "missing_links": sorted(set(missing_links)),
-            "dangling_refs": sorted(set(dangling_refs)),
+            "missing_links": sorted(missing_links),
+            "dangling_refs": sorted(dangling_refs),
             "span_conflicts": span_conflicts,
             "duplicate_ids": duplicate_ids,
         },
@@ -52,7 +57,7 @@ def run_checks(
             "rad": len(rad_ids),
             "po": len(po_ids),
             "ead": len(ead_ids),
-            "decision_points": sum(1 for _ in _iter_decision_points(wizard)),
+            "decision_points": decision_point_count,
         },
     }
 
@@ -62,34 +67,38 @@ def run_checks(
 
 def save_report(report: Dict[str, object], path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+        return
     with path.open("w", encoding="utf-8") as handle:
         json.dump(report, handle, indent=2)
 
 
-def _find_duplicates(catalog: Dict[str, List[Dict[str, object]]]) -> List[str]:
+def _scan_catalog(
+    catalog: Dict[str, List[Dict[str, object]]],
+) -> Tuple[Dict[str, Set[str]], List[str], List[str]]:
+    """Collect ids per type, duplicate ids, and span/page conflicts in one pass."""
+
+    ids_by_type: dict[str, set[str]] = {}
     seen: Set[str] = set()
     duplicates: Set[str] = set()
-    for items in catalog.values():
+    conflicts: list[str] = []
+    for item_type, items in catalog.items():
+        type_ids = ids_by_type.setdefault(item_type, set())
         for item in items:
             identifier = item.get("id")
+            type_ids.add(identifier)
             if identifier in seen:
                 duplicates.add(identifier)
             else:
                 seen.add(identifier)
-    return sorted(duplicates)
-
 
-def _find_missing_spans(catalog: Dict[str, List[Dict[str, object]]]) -> List[str]:
-    conflicts: list[str] = []
-    for item_type, items in catalog.items():
-        for item in items:
             span = item.get("span")
-            page = item.get("page")
             if span is None or not isinstance(span, list) or len(span) != 2:
-                conflicts.append(f"{item_type}:{item.get('id')} missing span")
-            if page is None:
-                conflicts.append(f"{item_type}:{item.get('id')} missing page")
-    return conflicts
+                conflicts.append(f"{item_type}:{identifier} missing span")
+            if item.get("page") is None:
+                conflicts.append(f"{item_type}:{identifier} missing page")
+    return ids_by_type, sorted(duplicates), conflicts
 
 
 def _iter_decision_points(wizard: Dict[str, object]):
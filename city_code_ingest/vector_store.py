@@ -2,8 +2,16 @@
 
 from __future__ import annotations
 
+import asyncio
+import threading
+from collections import deque
 from dataclasses import dataclass
-from typing import Any, Iterable, List, Optional
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+_INDEX_CACHE: Dict[Tuple[Any, ...], Tuple[Any, Any]] = {}
+_INDEX_CACHE_LOCK = threading.Lock()
 
 
 @dataclass
@@ -12,6 +20,9 @@ class PineconeVectorStore:
     index_name: str
     environment: Optional[str] = None
     host: Optional[str] = None
+    # Pinecone caps request size; batches are sent concurrently on the index's thread pool.
+    batch_size: int = 100
+    pool_threads: int = 30
 
     _client: Any = None
     _index: Any = None
@@ -20,6 +31,17 @@ class PineconeVectorStore:
         if self._index is not None:
             return self._index
 
+        # Stores are created per upsert call; sharing the connected index keeps
+        # its connection pool (and TLS sessions) alive across them.
+        key = (self.api_key, self.index_name, self.environment, self.host, self.pool_threads)
+        with _INDEX_CACHE_LOCK:
+            connection = _INDEX_CACHE.get(key)
+            if connection is None:
+                connection = _INDEX_CACHE[key] = self._connect()
+        self._client, self._index = connection
+        return self._index
+
+    def _connect(self) -> Tuple[Any, Any]:
         try:
             import pinecone  # type: ignore
         except ImportError as exc:  # pragma: no cover - depends on optional dependency
@@ -30,39 +52,79 @@ class PineconeVectorStore:
             if self.environment:
                 kwargs["environment"] = self.environment
             client = pinecone.Pinecone(**kwargs)
-            index_kwargs = {}
+            index_kwargs = {"pool_threads": self.pool_threads}
             if self.host:
                 index_kwargs["host"] = self.host
-            index = client.Index(self.index_name, **index_kwargs)
-            self._client = client
-            self._index = index
-            return index
+            return client, client.Index(self.index_name, **index_kwargs)
 
         # Legacy SDK fallback
         init_kwargs = {"api_key": self.api_key}
         if self.environment:
             init_kwargs["environment"] = self.environment
         pinecone.init(**init_kwargs)
-        index_kwargs = {}
+        index_kwargs = {"pool_threads": self.pool_threads}
         if self.host:
             index_kwargs["host"] = self.host
-        index = pinecone.Index(self.index_name, **index_kwargs)
-        self._client = pinecone
-        self._index = index
-        return index
+        return pinecone, pinecone.Index(self.index_name, **index_kwargs)
 
     @property
     def index(self) -> Any:
         return self._ensure_index()
 
     def upsert_embeddings(self, vectors: Iterable[dict], *, namespace: Optional[str] = None) -> int:
-        vectors_list: List[dict] = list(vectors)
-        if not vectors_list:
-            return 0
+        """Upsert ``vectors`` in ``batch_size`` chunks with the requests in flight concurrently.
+
+        ``vectors`` is consumed lazily: at most ``pool_threads`` batches are
+        outstanding at once, so memory stays bounded for arbitrarily long streams.
+        """
+
+        pending: deque[Any] = deque()
+        total = 0
+        for batch in _chunks(vectors, self.batch_size):
+            if len(pending) >= self.pool_threads:
+                pending.popleft().get()
+            index = self._ensure_index()
+            pending.append(index.upsert(vectors=batch, namespace=namespace, async_req=True))
+            total += len(batch)
+
+        while pending:
+            pending.popleft().get()
+        return total
+
+    async def upsert_embeddings_async(self, vectors: Iterable[dict], *, namespace: Optional[str] = None) -> int:
+        """Upsert ``vectors`` in ``batch_size`` chunks with up to ``pool_threads`` requests in flight.
+
+        Each batch is sent from a worker thread and the requests are gathered on
+        the event loop. ``vectors`` is consumed lazily: a new batch is only read
+        once one of the ``pool_threads`` slots is free, as in the sync path.
+        """
+
+        index = await asyncio.to_thread(self._ensure_index)
+        slots = asyncio.Semaphore(self.pool_threads)
+
+        async def send(batch: List[dict]) -> int:
+            try:
+                await asyncio.to_thread(index.upsert, vectors=batch, namespace=namespace)
+            finally:
+                slots.release()
+            return len(batch)
+
+        tasks: list[asyncio.Task[int]] = []
+        try:
+            for batch in _chunks(vectors, self.batch_size):
+                await slots.acquire()
+                tasks.append(asyncio.create_task(send(batch)))
+            return sum(await asyncio.gather(*tasks))
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
 
-        index = self._ensure_index()
-        index.upsert(vectors=vectors_list, namespace=namespace)
-        return len(vectors_list)
+def _chunks(iterable: Iterable[dict], size: int) -> Iterator[List[dict]]:
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
 
 
 __all__ = ["PineconeVectorStore"]
@@ -4,9 +4,17 @@ from __future__ import annotations
 
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
+try:  # pragma: no cover - optional dependency (pinecone gRPC client)
+    from google.protobuf.json_format import MessageToDict
+    from google.protobuf.message import Message as ProtobufMessage
+except ImportError:  # pragma: no cover - REST-only installs
+    MessageToDict = None  # type: ignore
+    ProtobufMessage = None  # type: ignore
+
 
 ENV_PATH = Path(__file__).resolve().parents[1] / ".env"
 
@@ -21,6 +29,11 @@ def _clean_env_value(key: str) -> Optional[str]:
 def _to_serializable(value):
     if isinstance(value, (dict, list, str, int, float, type(None))):
         return value
+    # SDK response models convert themselves faster than the vars() walk below.
+    if hasattr(value, "model_dump"):
+        return value.model_dump(mode="json")
+    if ProtobufMessage is not None and isinstance(value, ProtobufMessage):
+        return MessageToDict(value)
     if hasattr(value, "to_dict"):
         return value.to_dict()
     if hasattr(value, "__dict__"):
@@ -32,15 +45,13 @@ def load_env(path: Path) -> None:
     if not path.exists():
         return
 
-    with path.open("r", encoding="utf-8") as handle:
-        for line in handle:
-            if not line or line.strip().startswith("#"):
-                continue
-            if "=" not in line:
-                continue
-            key, value = line.strip().split("=", 1)
-            if key and key not in os.environ:
-                os.environ[key] = value
+    for raw_line in path.read_text(encoding="utf-8").splitlines():
+        line = raw_line.strip()
+        if not line or line.startswith("#") or "=" not in line:
+            continue
+        key, value = line.split("=", 1)
+        if key:
+            os.environ.setdefault(key, value)
 
 
 def check_openai(model: str = "text-embedding-3-small") -> bool:
@@ -126,8 +137,12 @@ def main() -> None:
     if namespace in {"", "default"}:
         namespace = None
 
-    ok_openai = check_openai()
-    ok_pinecone = check_pinecone(namespace=namespace)
+    # The two checks are independent network round-trips, so run them side by side.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        openai_check = executor.submit(check_openai)
+        pinecone_check = executor.submit(check_pinecone, namespace=namespace)
+        ok_openai = openai_check.result()
+        ok_pinecone = pinecone_check.result()
 
     if ok_openai and ok_pinecone:
         print("[status] All integrations verified")